@@ -27,9 +27,9 @@ class AgentBase:
         self.fast_model_url = fast_model_url
         self.model_mode = model_mode
         
-        # Add memory access
-        from memory_store import MemoryStore
-        self.memory = MemoryStore(project_name)
+        # Add memory access (shared per-project store, not reloaded per agent)
+        from core.registry import REGISTRY
+        self.memory = REGISTRY.get_memory_store(project_name)
     
     def log(self, content: str, event_type: str = "info") -> None:
         """Log to both EventBus (ephemeral) and AuditLog (persistent)"""
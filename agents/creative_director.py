@@ -317,8 +317,8 @@ Return as JSON with keys: core_problems, proposed_canon_rules, guidance
             return
         
         # Get graph store
-        from graph_store import GraphStore
-        graph = GraphStore(self.project_name)
+        from core.registry import REGISTRY
+        graph = REGISTRY.get_graph_store(self.project_name)
         
         for rule in valid_rules:
             # Add to graph
@@ -15,7 +15,6 @@ if TYPE_CHECKING:
 
 from core.event_bus import EventBus
 from core.audit_log import AuditLog
-from memory_store import MemoryStore
 
 
 class AgentFactory:
@@ -35,7 +34,10 @@ class AgentFactory:
         self.audit_log = audit_log
         self.fast_model_url = fast_model_url
         self.model_mode = model_mode
-        self.memory = MemoryStore(project_name)
+        
+        # Shared per-project store (import here: the registry imports this module)
+        from core.registry import REGISTRY
+        self.memory = REGISTRY.get_memory_store(project_name)
     
     def create_plot_architect(self) -> "PlotArchitect":
         """Create fresh PlotArchitect instance"""
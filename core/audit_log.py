@@ -3,14 +3,34 @@ Persistent append-only log for historical agent activity.
 Stored as JSON Lines for easy streaming and grep.
 """
 
+import heapq
+import itertools
 import json
 import os
-from typing import Dict, Any, List, Optional, Iterator
+import re
+import threading
+from typing import Dict, Any, List, Optional, Iterator, Iterable, Tuple
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from config.settings import STORAGE_CONFIG
 
+# Word tokens for full-text search (matched case-insensitively)
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _leaf_values(value: Any) -> Iterator[str]:
+    """Scalar values nested in a payload, as strings (keys are skipped)"""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _leaf_values(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _leaf_values(item)
+    elif value is not None:
+        yield str(value)
+
+
 @dataclass
 class AuditEntry:
     """Single audit log entry"""
@@ -39,6 +59,9 @@ class AuditLog:
     - Append-only (never modify existing entries)
     - Efficient streaming for large logs
     - Optional replay capability
+    - In-memory index of line offsets by event_type and (event_type, step),
+      so filtered searches seek straight to matching lines
+    - Inverted word index for full-text search, built on first use
     """
     
     def __init__(self, project_name: str, base_dir: str = None):
@@ -55,6 +78,20 @@ class AuditLog:
         # Use new unified path
         self.log_path = self.paths.audit
         self._ensure_log_exists()
+        
+        # Guards the indexes below; the instance is shared across session threads
+        self._lock = threading.Lock()
+        
+        # Byte offsets of each line, by event_type and by (event_type, step)
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_type_step: Dict[Tuple[str, str], List[int]] = {}
+        self._indexed_size = 0
+        with self._lock:
+            self._refresh_index()
+        
+        # Byte offsets by lowercase word; None until the first text search
+        self._by_token: Optional[Dict[str, List[int]]] = None
+        self._token_indexed_size = 0
     
     def _migrate_from_legacy(self) -> None:
         """Migrate audit log from legacy location"""
@@ -80,6 +117,84 @@ class AuditLog:
         if not self.log_path.exists():
             self.log_path.touch()
     
+    def _refresh_index(self) -> None:
+        """Index any complete lines written since the last refresh (hold self._lock)"""
+        if not self.log_path.exists():
+            return
+        if self.log_path.stat().st_size <= self._indexed_size:
+            return
+        
+        with open(self.log_path, 'rb') as f:
+            f.seek(self._indexed_size)
+            offset = self._indexed_size
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Partially written line; pick it up next time
+                
+                if line.strip():
+                    data = json.loads(line)
+                    event_type = data.get("event_type")
+                    self._by_type.setdefault(event_type, []).append(offset)
+                    
+                    payload = data.get("payload")
+                    step = payload.get("step") if isinstance(payload, dict) else None
+                    if step is not None:
+                        self._by_type_step.setdefault((event_type, step), []).append(offset)
+                
+                offset += len(line)
+        
+        self._indexed_size = offset
+    
+    def _refresh_token_index(self) -> None:
+        """Add words of lines written since the last text search to the inverted index (hold self._lock)"""
+        if self._by_token is None:
+            self._by_token = {}
+        if not self.log_path.exists():
+            return
+        if self.log_path.stat().st_size <= self._token_indexed_size:
+            return
+        
+        with open(self.log_path, 'rb') as f:
+            f.seek(self._token_indexed_size)
+            offset = self._token_indexed_size
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Partially written line; pick it up next time
+                
+                if line.strip():
+                    data = json.loads(line)
+                    text = " ".join((
+                        str(data.get("sender", "")),
+                        str(data.get("recipient", "")),
+                        *_leaf_values(data.get("payload")),
+                    ))
+                    for token in set(_TOKEN_RE.findall(text.lower())):
+                        self._by_token.setdefault(token, []).append(offset)
+                
+                offset += len(line)
+        
+        self._token_indexed_size = offset
+    
+    def _match_text(self, q: str) -> set:
+        """Offsets of lines containing every word of q"""
+        terms = set(_TOKEN_RE.findall(q.lower()))
+        if not terms:
+            return set()
+        with self._lock:
+            self._refresh_token_index()
+            postings = sorted((list(self._by_token.get(t, [])) for t in terms), key=len)
+        matched = set(postings[0])
+        for other in postings[1:]:
+            matched.intersection_update(other)
+        return matched
+    
+    def _read_at(self, offsets: Iterable[int]) -> Iterator[AuditEntry]:
+        """Read entries at the given line offsets"""
+        with open(self.log_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield AuditEntry.from_json(f.readline().decode('utf-8'))
+    
     def append(self, event_type: str, sender: str, recipient: str, 
                payload: Dict[str, Any]) -> None:
         """Append entry to audit log"""
@@ -95,6 +210,21 @@ class AuditLog:
         with open(self.log_path, 'a', encoding='utf-8') as f:
             f.write(entry.to_json() + '\n')
     
+    @property
+    def version(self) -> Tuple[int, int]:
+        """
+        (size, mtime_ns) of the log file; lets readers cache search results.
+        
+        Taken from the file rather than this instance, so it also changes for
+        lines appended by other instances or processes, and after the log is
+        deleted and recreated.
+        """
+        try:
+            st = self.log_path.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_size, st.st_mtime_ns)
+    
     def read_all(self) -> List[AuditEntry]:
         """Read all entries (use sparingly for large logs)"""
         return list(self.stream())
@@ -120,25 +250,127 @@ class AuditLog:
     
     def search(self, event_type: Optional[str] = None, 
                sender: Optional[str] = None,
-               limit: Optional[int] = None) -> List[AuditEntry]:
-        """Search audit log with filters"""
-        results = []
+               limit: Optional[int] = None,
+               step_in: Optional[Iterable[str]] = None,
+               offset: int = 0,
+               q: Optional[str] = None,
+               sender_contains: Optional[str] = None) -> List[AuditEntry]:
+        """
+        Search audit log with filters.
         
-        for entry in self.stream():
-            if event_type and entry.event_type != event_type:
-                continue
+        With event_type set, only indexed matching lines are read;
+        step_in additionally restricts to entries whose payload "step"
+        is one of the given values. Results keep log order.
+        
+        q is a full-text query: entries must contain every word of it in
+        their sender, recipient or payload values (case-insensitive). It is
+        answered from the inverted word index.
+        
+        sender_contains keeps entries whose sender contains it as a
+        substring (case-insensitive).
+        
+        offset skips that many matches (for paging). Without a sender
+        filter, indexed searches skip by offset and never read the
+        skipped lines.
+        """
+        return list(self.search_iter(event_type, sender, limit, step_in, offset, q,
+                                     sender_contains))
+    
+    def search_iter(self, event_type: Optional[str] = None, 
+                    sender: Optional[str] = None,
+                    limit: Optional[int] = None,
+                    step_in: Optional[Iterable[str]] = None,
+                    offset: int = 0,
+                    q: Optional[str] = None,
+                    sender_contains: Optional[str] = None) -> Iterator[AuditEntry]:
+        """
+        Same as search(), yielding each match as soon as it is read.
+        
+        Lets callers render the first results before the rest are read.
+        """
+        offsets = self._indexed_offsets(event_type, step_in, q)
+        if offsets is not None:
+            if offset and not sender and not sender_contains:
+                offsets = itertools.islice(offsets, offset, None)
+                offset = 0
+            entries = self._read_at(offsets)
+        else:
+            entries = self.stream()
+        if step_in is not None and not event_type:
+            steps = set(step_in)
+            entries = (e for e in entries if e.payload.get("step") in steps)
+        
+        found = 0
+        for entry in entries:
             if sender and entry.sender != sender:
                 continue
+            if sender_contains and sender_contains.lower() not in entry.sender.lower():
+                continue
+            
+            if offset:
+                offset -= 1
+                continue
             
-            results.append(entry)
+            yield entry
+            found += 1
             
-            if limit and len(results) >= limit:
+            if limit and found >= limit:
                 break
+    
+    def _indexed_offsets(self, event_type: Optional[str],
+                         step_in: Optional[Iterable[str]],
+                         q: Optional[str]) -> Optional[Iterable[int]]:
+        """Offsets matching the indexed filters in log order, or None to scan"""
+        offsets = None
+        if event_type:
+            with self._lock:
+                self._refresh_index()
+                if step_in is not None:
+                    postings = [
+                        list(self._by_type_step.get((event_type, step), []))
+                        for step in set(step_in)
+                    ]
+                else:
+                    postings = [list(self._by_type.get(event_type, []))]
+            offsets = heapq.merge(*postings) if len(postings) > 1 else postings[0]
+        if q:
+            matched = self._match_text(q)
+            if offsets is None:
+                offsets = sorted(matched)
+            else:
+                offsets = [o for o in offsets if o in matched]
+        return offsets
+    
+    def count(self, event_type: Optional[str] = None, q: Optional[str] = None,
+              sender_contains: Optional[str] = None) -> int:
+        """
+        Number of entries, optionally of one event_type and/or matching q
+        and sender_contains (see search()).
         
-        return results
+        Served from the indexes, which only read lines appended since the
+        last refresh, so repeated calls don't rescan the file. Senders
+        aren't indexed, so with sender_contains the candidate lines are read.
+        """
+        if sender_contains:
+            return sum(1 for _ in self.search_iter(event_type, q=q,
+                                                   sender_contains=sender_contains))
+        if q:
+            return sum(1 for _ in self._indexed_offsets(event_type, None, q))
+        with self._lock:
+            self._refresh_index()
+            if event_type is None:
+                return sum(len(offsets) for offsets in self._by_type.values())
+            return len(self._by_type.get(event_type, []))
     
     def clear(self) -> None:
         """Clear audit log (destructive, use with caution)"""
-        if self.log_path.exists():
-            self.log_path.unlink()
-        self._ensure_log_exists()
\ No newline at end of file
+        with self._lock:
+            if self.log_path.exists():
+                self.log_path.unlink()
+            self._ensure_log_exists()
+            self._by_type = {}
+            self._by_type_step = {}
+            self._indexed_size = 0
+            if self._by_token is not None:
+                self._by_token = {}
+            self._token_indexed_size = 0
\ No newline at end of file
@@ -5,14 +5,15 @@ Lives only during orchestrator runtime.
 
 from typing import Dict, List, Callable, Any, Optional
 from collections import deque
+import itertools
 from dataclasses import dataclass, field
 import time
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
-    """Lightweight event for real-time coordination"""
+    """Lightweight event for real-time coordination (slotted: no per-event __dict__)"""
     id: str
     project_name: str
     sender: str
@@ -73,6 +74,7 @@ class EventBus:
                     self.project_name,
                     'eventbus_message',
                     {
+                        'id': event.id,
                         'sender': sender,
                         'recipient': recipient,
                         'event_type': event_type,
@@ -94,10 +96,22 @@ class EventBus:
             self.subscribers[agent_name] = []
         self.subscribers[agent_name].append(callback)
     
+    def tail(self, n: int) -> List[Event]:
+        """Last n events, oldest first, copying only those n"""
+        if n <= 0:
+            return []
+        try:
+            events = list(itertools.islice(reversed(self.buffer), n))
+        except RuntimeError:
+            # Published to from another thread mid-read; take a snapshot
+            return list(self.buffer)[-n:]
+        events.reverse()
+        return events
+    
     def get_recent(self, agent_name: str, limit: int = 10) -> List[Event]:
         """Get recent events for an agent (from ring buffer)"""
         return [
-            e for e in list(self.buffer)[-limit:]
+            e for e in self.tail(limit)
             if e.recipient in (agent_name, "ALL")
         ]
     
@@ -4,12 +4,17 @@ Thread-safe feedback injection system for Phase 1.
 
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
 
+# Fire-and-forget EventBus publishes; one worker keeps them in order
+_PUBLISH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback_publish")
+
+
 class FeedbackType(Enum):
     """Types of feedback that can be injected."""
     GUIDANCE = "guidance"
@@ -104,6 +109,54 @@ class FeedbackManager:
             self.feedback_messages.append(message)
             return feedback_id
     
+    def add_and_publish(
+        self,
+        event_bus,
+        target_agent: str,
+        feedback_type: FeedbackType,
+        content: str,
+        priority: FeedbackPriority = FeedbackPriority.NORMAL,
+        source: str = "user"
+    ) -> str:
+        """
+        Add a feedback message and announce it on the EventBus.
+        
+        The message is stored synchronously; the EventBus publish (and
+        its subscriber/WebSocket fan-out) runs on a background worker so
+        the caller doesn't wait on it.
+        
+        Args:
+            event_bus: Project EventBus to publish on
+            target_agent: Agent name or "ALL" for broadcast
+            feedback_type: Type of feedback
+            content: Feedback content
+            priority: Priority level
+            source: Source of feedback (also the event sender)
+            
+        Returns:
+            Feedback message ID
+        """
+        feedback_id = self.add_feedback(
+            target_agent=target_agent,
+            feedback_type=feedback_type,
+            content=content,
+            priority=priority,
+            source=source
+        )
+        
+        _PUBLISH_POOL.submit(
+            event_bus.publish,
+            sender=source,
+            recipient=target_agent,
+            event_type=f"user_feedback_{feedback_type.value}",
+            payload={
+                "content": content,
+                "priority": priority.value,
+                "feedback_id": feedback_id
+            }
+        )
+        return feedback_id
+    
     def get_feedback_for_agent(
         self,
         agent_name: str,
@@ -141,6 +194,29 @@ class FeedbackManager:
             )
             return messages
     
+    def get_unprocessed_grouped_by_agent(self) -> Dict[str, List[FeedbackMessage]]:
+        """
+        Get all unprocessed feedback, bucketed by target agent, in one pass.
+        
+        Equivalent to calling get_feedback_for_agent(agent,
+        include_broadcast=False) for every agent, with the same ordering.
+        
+        Returns:
+            Dict of target_agent -> list of feedback messages
+        """
+        with self.lock:
+            grouped: Dict[str, List[FeedbackMessage]] = {}
+            for msg in self.feedback_messages:
+                if not msg.processed:
+                    grouped.setdefault(msg.target_agent, []).append(msg)
+            
+            for messages in grouped.values():
+                messages.sort(
+                    key=lambda x: (-x.priority.value, x.created_at),
+                    reverse=True
+                )
+            return grouped
+    
     def mark_as_processed(self, feedback_id: str) -> bool:
         """
         Mark a feedback message as processed.
@@ -5,6 +5,7 @@ Async pipeline controller with pause/resume capabilities.
 import asyncio
 import threading
 import time
+from concurrent.futures import Future
 from enum import Enum
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, field
@@ -44,6 +45,7 @@ class PipelineController:
         self.feedback_manager = FeedbackManager(project_name)
         self.current_task: Optional[str] = None
         self.pipeline_thread: Optional[threading.Thread] = None
+        self.pipeline_future: Optional[Future] = None
         self.pause_event = threading.Event()
         self.stop_event = threading.Event()
         self.lock = threading.RLock()
@@ -70,6 +72,11 @@ class PipelineController:
             
         Returns:
             True if pipeline started successfully
+            
+        Note:
+            ``pipeline_future`` is replaced on each successful start and
+            resolves with the pipeline result (or its exception) once the
+            run finishes. Callers can wait on it instead of polling status.
         """
         with self.lock:
             if self.status in [PipelineStatus.RUNNING, PipelineStatus.PAUSED]:
@@ -81,11 +88,14 @@ class PipelineController:
             self.current_task = task_name
             self.stop_event.clear()
             self.pause_event.clear()
+            self.pipeline_future = Future()
             
-            # Start pipeline in background thread
+            # Start pipeline in background thread; daemon so a running or
+            # paused pipeline never holds up interpreter shutdown
             self.pipeline_thread = threading.Thread(
                 target=self._run_pipeline,
-                args=(pipeline_func, kwargs),
+                args=(pipeline_func, kwargs, self.pipeline_future),
+                name=f"pipeline-{self.project_name}",
                 daemon=True
             )
             self.pipeline_thread.start()
@@ -96,7 +106,8 @@ class PipelineController:
             
             return True
     
-    def _run_pipeline(self, pipeline_func: Callable, kwargs: Dict[str, Any]):
+    def _run_pipeline(self, pipeline_func: Callable, kwargs: Dict[str, Any],
+                      future: Future):
         """Internal method to run pipeline with status broadcasts."""
         try:
             # Broadcast start
@@ -115,6 +126,8 @@ class PipelineController:
                 self.progress.percent_complete = 100.0
                 self.current_task = None
                 self._broadcast_status()
+            
+            future.set_result(result)
         
         except Exception as e:
             # Pipeline failed
@@ -122,6 +135,8 @@ class PipelineController:
                 self.status = PipelineStatus.ERROR
                 self.current_task = f"Error: {str(e)}"
                 self._broadcast_status()
+            
+            future.set_exception(e)
         
         finally:
             # Notify status change
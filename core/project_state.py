@@ -211,6 +211,11 @@ class ProjectState:
         """Static version of _state_path"""
         return Path(base_dir) / project_name / "state.json"
     
+    @classmethod
+    def path_for(cls, project_name: str, base_dir: str = "project_state") -> Path:
+        """Path to a project's state file (for change detection, e.g. mtime)"""
+        return cls._state_path_static(project_name, base_dir)
+    
     @classmethod
     def _migrate(cls, data: Dict[str, Any], from_version: str) -> Dict[str, Any]:
         """Migrate data from old version to current"""
@@ -4,7 +4,8 @@ Singleton pattern with lazy initialization.
 """
 
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Callable, Optional
 from .event_bus import EventBus
 from .audit_log import AuditLog
 from .project_state import ProjectState
@@ -21,119 +22,128 @@ class ProjectRegistry:
     
     _instance = None
     _instances: Dict[str, Any] = {}
+    # Reentrant: some constructors look up other registry instances
+    _lock = threading.RLock()
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
+    def _get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the instance stored under key, creating it on first use.
+        
+        Creation happens under the lock, so concurrent sessions asking
+        for the same project never build (and load from disk) twice.
+        """
+        instance = self._instances.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    instance = factory()
+                    self._instances[key] = instance
+        return instance
+    
     def get_event_bus(self, project_name: str) -> EventBus:
         """Get or create EventBus for project."""
-        key = f"event_bus_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = EventBus(project_name)
-        return self._instances[key]
+        return self._get_or_create(f"event_bus_{project_name}", lambda: EventBus(project_name))
     
     def get_audit_log(self, project_name: str) -> AuditLog:
         """Get or create AuditLog for project."""
-        key = f"audit_log_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = AuditLog(project_name)
-        return self._instances[key]
+        return self._get_or_create(f"audit_log_{project_name}", lambda: AuditLog(project_name))
     
     def get_memory_store(self, project_name: str):
         """Get or create MemoryStore for project."""
-        key = f"memory_store_{project_name}"
-        if key not in self._instances:
-            from memory_store import MemoryStore
-            self._instances[key] = MemoryStore(project_name)
-        return self._instances[key]
+        from memory_store import MemoryStore
+        return self._get_or_create(f"memory_store_{project_name}", lambda: MemoryStore(project_name))
     
     def get_graph_store(self, project_name: str):
         """Get or create GraphStore for project."""
-        key = f"graph_store_{project_name}"
-        if key not in self._instances:
-            from graph_store import GraphStore
-            self._instances[key] = GraphStore(project_name)
-        return self._instances[key]
+        from graph_store import GraphStore
+        return self._get_or_create(f"graph_store_{project_name}", lambda: GraphStore(project_name))
     
     def get_task_manager(self, project_name: str):
         """Get or create TaskManager for project."""
-        key = f"task_manager_{project_name}"
-        if key not in self._instances:
-            from task_manager import TaskManager
-            self._instances[key] = TaskManager(project_name)
-        return self._instances[key]
+        from task_manager import TaskManager
+        return self._get_or_create(f"task_manager_{project_name}", lambda: TaskManager(project_name))
     
     def get_output_manager(self, project_name: str) -> OutputManager:
         """Get or create OutputManager for project."""
-        key = f"output_manager_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = OutputManager(project_name)
-        return self._instances[key]
+        return self._get_or_create(f"output_manager_{project_name}", lambda: OutputManager(project_name))
     
     def get_project_state(self, project_name: str) -> ProjectState:
         """Get or create ProjectState for project."""
-        key = f"project_state_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = ProjectState.load(project_name)
-        return self._instances[key]
+        return self._get_or_create(f"project_state_{project_name}", lambda: ProjectState.load(project_name))
     
     def get_agent_factory(self, project_name: str) -> AgentFactory:
         """Get or create AgentFactory for project."""
-        key = f"agent_factory_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = AgentFactory(project_name)
-        return self._instances[key]
+        return self._get_or_create(f"agent_factory_{project_name}", lambda: AgentFactory(project_name))
     
     def get_storage_paths(self, project_name: str) -> ProjectPaths:  # CHANGED return type
         """Get or create StoragePaths for project."""
-        key = f"storage_paths_{project_name}"
-        if key not in self._instances:
-            self._instances[key] = ProjectPaths.for_project(project_name)  # CHANGED call
-        return self._instances[key]
+        return self._get_or_create(
+            f"storage_paths_{project_name}",
+            lambda: ProjectPaths.for_project(project_name)  # CHANGED call
+        )
     
     def get_pipeline_controller(self, project_name: str):
         """Get or create PipelineController for project."""
-        key = f"pipeline_controller_{project_name}"
-        if key not in self._instances:
+        def create():
             # Import here to avoid circular imports
             try:
                 from core.pipeline_controller import PipelineController
-                self._instances[key] = PipelineController(project_name)
+                return PipelineController(project_name)
             except ImportError as e:
                 # Create a mock if not available
                 print(f"Warning: PipelineController not available, using mock: {e}")
-                self._instances[key] = MockPipelineController(project_name)
-        return self._instances[key]
+                return MockPipelineController(project_name)
+        
+        return self._get_or_create(f"pipeline_controller_{project_name}", create)
+    
+    def is_pipeline_active(self, project_name: str) -> bool:
+        """
+        Check whether the project's pipeline is running or paused.
+        
+        Reads the status of an existing controller only; a project that
+        never had a controller created is idle, and none is constructed.
+        """
+        controller = self._instances.get(f"pipeline_controller_{project_name}")
+        if controller is None:
+            return False
+        status = getattr(controller.status, "value", controller.status)
+        return status in ("running", "paused")
     
     def get_feedback_manager(self, project_name: str):
         """Get or create FeedbackManager for project."""
-        key = f"feedback_manager_{project_name}"
-        if key not in self._instances:
+        def create():
             # Import here to avoid circular imports
             try:
                 from core.feedback_manager import FeedbackManager
-                self._instances[key] = FeedbackManager(project_name)
+                return FeedbackManager(project_name)
             except ImportError as e:
                 # Create a mock if not available
                 print(f"Warning: FeedbackManager not available, using mock: {e}")
-                self._instances[key] = MockFeedbackManager(project_name)
-        return self._instances[key]
+                return MockFeedbackManager(project_name)
+        
+        return self._get_or_create(f"feedback_manager_{project_name}", create)
     
     def clear_project(self, project_name: str) -> None:
         """Clear all instances for a project."""
-        keys_to_remove = []
-        for key in self._instances:
-            if key.endswith(f"_{project_name}"):
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self._instances[key]
+        with self._lock:
+            keys_to_remove = []
+            for key in self._instances:
+                if key.endswith(f"_{project_name}"):
+                    keys_to_remove.append(key)
+            
+            for key in keys_to_remove:
+                del self._instances[key]
     
     def clear_all(self) -> None:
         """Clear all instances."""
-        self._instances.clear()
+        with self._lock:
+            self._instances.clear()
 
 
 # Mock classes for when Phase 1 components aren't available
@@ -2,8 +2,9 @@
 Fast model client using vLLM server with centralized configuration.
 """
 
+import json
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from config.settings import MODEL_CONFIG
 
 
@@ -32,4 +33,45 @@ def chat_fast(messages: List[Dict[str, str]], model: str = None) -> str:
     response.raise_for_status()
     
     data = response.json()
-    return data["choices"][0]["message"]["content"]
\ No newline at end of file
+    return data["choices"][0]["message"]["content"]
+
+
+def chat_fast_stream(messages: List[Dict[str, str]], model: str = None) -> Iterator[str]:
+    """
+    Stream a chat completion from the fast model server.
+    
+    Uses the OpenAI-compatible ``stream: true`` mode (server-sent events)
+    and yields content deltas as they arrive.
+    
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+        model: Model name (defaults to configured fast model)
+        
+    Yields:
+        Generated text chunks
+        
+    Raises:
+        requests.HTTPError: If request fails
+    """
+    model = model or MODEL_CONFIG.fast_model_name
+    
+    payload: Dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "stream": True,
+    }
+    
+    with requests.post(MODEL_CONFIG.fast_model_url, json=payload, stream=True) as response:
+        response.raise_for_status()
+        
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            
+            data = line[len(b"data:"):].strip()
+            if data == b"[DONE]":
+                break
+            
+            delta = json.loads(data)["choices"][0].get("delta", {})
+            if delta.get("content"):
+                yield delta["content"]
@@ -2,8 +2,11 @@
 Heavy model (7B) using Transformers with centralized configuration.
 """
 
+import threading
+from typing import Iterator
+
 import streamlit as st
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, TextIteratorStreamer
 import torch
 from config.settings import MODEL_CONFIG
 
@@ -40,4 +43,51 @@ def generate_with_heavy_model(prompt: str, max_new_tokens: int = None) -> str:
     inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
     outputs = model.generate(**inputs, max_new_tokens=max_new_tokens)
     result = tokenizer.decode(outputs[0], skip_special_tokens=True)
-    return result
\ No newline at end of file
+    return result
+
+
+def stream_with_heavy_model(prompt: str, max_new_tokens: int = None) -> Iterator[str]:
+    """
+    Generate text using heavy model, yielding text chunks as they decode.
+    
+    generate() runs on a worker thread and feeds a TextIteratorStreamer,
+    so callers (e.g. st.write_stream) can render the first tokens right
+    away. Unlike generate_with_heavy_model, the prompt is not echoed.
+    An exception from generate() is re-raised here once the stream ends,
+    and a chunk that takes longer than MODEL_CONFIG.request_timeout
+    raises queue.Empty.
+    
+    Args:
+        prompt: Input prompt
+        max_new_tokens: Maximum tokens to generate (defaults to config)
+        
+    Yields:
+        Decoded text chunks
+    """
+    max_new_tokens = max_new_tokens or MODEL_CONFIG.default_max_tokens
+    
+    tokenizer, model = load_heavy_model()
+    inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+    # Bounded wait per chunk, so a stalled generate() surfaces as queue.Empty
+    streamer = TextIteratorStreamer(
+        tokenizer, skip_prompt=True, skip_special_tokens=True,
+        timeout=MODEL_CONFIG.request_timeout,
+    )
+    errors = []
+    
+    def _generate():
+        try:
+            model.generate(**inputs, max_new_tokens=max_new_tokens, streamer=streamer)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Always release the consumer, even when generate() raised
+            streamer.end()
+    
+    thread = threading.Thread(target=_generate, daemon=True)
+    thread.start()
+    
+    yield from streamer
+    thread.join()
+    if errors:
+        raise errors[0]
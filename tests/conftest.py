@@ -0,0 +1,29 @@
+"""
+Shared pytest configuration for the PinkBison test suite.
+
+Slow tests (marked with ``@pytest.mark.slow``) are skipped by default;
+pass ``--runslow`` to include them.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow was given."""
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="slow test: pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
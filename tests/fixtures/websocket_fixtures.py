@@ -5,34 +5,99 @@ Provides reusable fixtures for creating test projects, WebSocket connections,
 and mock components for testing real-time features.
 """
 
+import os
 import pytest
 import tempfile
+import time
 import shutil
 import json
 from pathlib import Path
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Callable
 from unittest.mock import Mock, MagicMock
 
 
-@pytest.fixture
+# Seed file contents for test_project_dir, encoded once at import
+_STATE_BYTES = json.dumps({
+    "metadata": {
+        "genre": "test",
+        "tone": "test",
+        "themes": [],
+        "setting": "test"
+    },
+    "agent_outputs": {},
+    "pipeline_history": [],
+    "continuity_notes": [],
+    "ui_inputs": {}
+}, indent=2).encode("ascii")
+
+_GRAPH_BYTES = json.dumps({
+    "entities": [],
+    "relationships": [],
+    "events": [],
+    "canon_rules": []
+}, indent=2).encode("ascii")
+
+
+def wait_until(
+    predicate: Callable[[], Any],
+    timeout: float = 2.0,
+    interval: float = 0.01
+) -> bool:
+    """
+    Poll a predicate until it is truthy or the timeout elapses.
+    
+    Returns as soon as the condition holds instead of sleeping for a
+    fixed interval.
+    
+    Returns:
+        True if the predicate became truthy, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write pre-encoded bytes to path with a single os.write call."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
 def test_project_name() -> str:
     """Provide a unique test project name."""
     return "test_realtime_project"
 
 
 @pytest.fixture
-def test_project_dir(test_project_name: str) -> Generator[Path, None, None]:
+def test_project_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    test_project_name: str
+) -> Generator[Path, None, None]:
     """
     Create a temporary project directory for testing.
     
+    Changes the working directory to ``tmp_path`` so code using the
+    relative ``project_state/`` layout writes to the temp dir instead
+    of the repository.
+    
     Yields:
         Path to temporary project directory
         
     Cleanup:
         Removes directory after test completes
     """
-    project_dir = Path(f"project_state/{test_project_name}")
-    project_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    project_dir = Path("project_state") / test_project_name
+    project_dir.mkdir(parents=True)
     
     # Create subdirectories
     (project_dir / "memory").mkdir(exist_ok=True)
@@ -41,28 +106,10 @@ def test_project_dir(test_project_name: str) -> Generator[Path, None, None]:
     (project_dir / "outputs" / "drafts").mkdir(parents=True, exist_ok=True)
     
     # Create empty state.json
-    state_file = project_dir / "state.json"
-    state_file.write_text(json.dumps({
-        "metadata": {
-            "genre": "test",
-            "tone": "test",
-            "themes": [],
-            "setting": "test"
-        },
-        "agent_outputs": {},
-        "pipeline_history": [],
-        "continuity_notes": [],
-        "ui_inputs": {}
-    }, indent=2))
+    _write_bytes(project_dir / "state.json", _STATE_BYTES)
     
     # Create empty graph.json
-    graph_file = project_dir / "graph.json"
-    graph_file.write_text(json.dumps({
-        "entities": [],
-        "relationships": [],
-        "events": [],
-        "canon_rules": []
-    }, indent=2))
+    _write_bytes(project_dir / "graph.json", _GRAPH_BYTES)
     
     # Create empty audit.jsonl
     audit_file = project_dir / "audit.jsonl"
@@ -75,6 +122,46 @@ def test_project_dir(test_project_name: str) -> Generator[Path, None, None]:
         shutil.rmtree(project_dir)
 
 
+@pytest.fixture(scope="class")
+def shared_bus(test_project_name: str):
+    """
+    Provide one EventBus shared by every test in a class.
+    
+    Prefer the ``bus`` fixture, which resets this instance per test.
+    """
+    from core.event_bus import EventBus
+    return EventBus(test_project_name)
+
+
+@pytest.fixture
+def bus(shared_bus):
+    """Provide the class-shared EventBus with buffer and subscribers cleared."""
+    shared_bus.buffer.clear()
+    shared_bus.subscribers.clear()
+    return shared_bus
+
+
+@pytest.fixture(scope="session")
+def ws_manager():
+    """
+    Start the global WebSocket server once for the whole test session.
+    
+    Yields:
+        The WEBSOCKET_MANAGER singleton (running unless the port is taken)
+        
+    Cleanup:
+        Stops the server when the session ends
+    """
+    from core.websocket_manager import WEBSOCKET_MANAGER
+    
+    WEBSOCKET_MANAGER.start_server()
+    wait_until(lambda: WEBSOCKET_MANAGER.running, timeout=2.0)
+    
+    yield WEBSOCKET_MANAGER
+    
+    WEBSOCKET_MANAGER.stop_server()
+
+
 @pytest.fixture
 def mock_websocket():
     """Create a mock WebSocket connection for testing."""
@@ -35,6 +35,10 @@ def run_tests(test_path, description):
         str(test_path),
         "-v",
         "--tb=short",
+        # Parallel workers (pytest-xdist); loadfile keeps each module, and
+        # its session-scoped WebSocket server, on a single worker
+        "-n", "auto",
+        "--dist", "loadfile",
         "-W", "ignore::DeprecationWarning"
     ]
     
@@ -7,13 +7,12 @@ Tests that EventBus correctly broadcasts events via WebSocket, matching actual i
 import pytest
 import json
 from unittest.mock import Mock, patch
-from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from tests.fixtures.websocket_fixtures import test_project_name
+from tests.fixtures.websocket_fixtures import (
+    test_project_name,
+    shared_bus,
+    bus
+)
 
 
 class TestEventBusWebSocketIntegration:
@@ -36,11 +35,8 @@ class TestEventBusWebSocketIntegration:
         assert len(bus.buffer) == 0
         assert bus.subscribers == {}
     
-    def test_eventbus_publish_creates_event(self, test_project_name):
+    def test_eventbus_publish_creates_event(self, bus):
         """Test publish method creates Event object."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
         event = bus.publish(
             sender="PlotArchitect",
             recipient="ProducerAgent",
@@ -80,23 +76,16 @@ class TestEventBusWebSocketIntegration:
         assert events_list[0].payload["index"] == 5
         assert events_list[-1].payload["index"] == 9
     
-    def test_eventbus_subscribe(self, test_project_name):
+    def test_eventbus_subscribe(self, bus):
         """Test subscribing to events."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
         callback = Mock()
         
         bus.subscribe("TestAgent", callback)
         assert "TestAgent" in bus.subscribers
         assert callback in bus.subscribers["TestAgent"]
     
-    def test_eventbus_get_recent(self, test_project_name):
+    def test_eventbus_get_recent(self, bus):
         """Test getting recent events for an agent."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
-        
         # Publish events to different recipients
         bus.publish("Sender1", "Agent1", "event1", {})
         bus.publish("Sender2", "Agent1", "event2", {})
@@ -116,12 +105,8 @@ class TestEventBusWebSocketIntegration:
 class TestEventBusWebSocketIntegration:
     """Test WebSocket integration in EventBus."""
     
-    def test_eventbus_has_websocket_integration(self, test_project_name):
+    def test_eventbus_has_websocket_integration(self, bus):
         """Test that EventBus attempts WebSocket broadcasting."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
-        
         # Publish event - should not crash even if WebSocket not available
         try:
             event = bus.publish(
@@ -157,23 +142,16 @@ class TestEventBusProjectIsolation:
         assert events1[0].type == "event1"
         assert events2[0].type == "event2"
     
-    def test_project_name_in_eventbus(self, test_project_name):
+    def test_project_name_in_eventbus(self, bus, test_project_name):
         """Test that project name is accessible from EventBus."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
         assert bus.project_name == test_project_name
 
 
 class TestEventBusErrorHandling:
     """Test error handling in EventBus."""
     
-    def test_publish_with_complex_payload(self, test_project_name):
+    def test_publish_with_complex_payload(self, bus):
         """Test publishing with nested payload."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
-        
         # Complex nested payload
         complex_payload = {
             "level1": {
@@ -195,12 +173,8 @@ class TestEventBusErrorHandling:
         except Exception as e:
             pytest.fail(f"EventBus.publish failed with complex payload: {e}")
     
-    def test_subscribe_with_valid_callback(self, test_project_name):
+    def test_subscribe_with_valid_callback(self, bus):
         """Test subscribing with valid callback function."""
-        from core.event_bus import EventBus
-        
-        bus = EventBus(test_project_name)
-        
         def callback(event):
             pass
         
@@ -212,13 +186,11 @@ class TestEventBusErrorHandling:
 class TestEventBusPerformance:
     """Test EventBus performance characteristics."""
     
-    def test_high_volume_publish(self, test_project_name):
+    @pytest.mark.slow
+    def test_high_volume_publish(self, bus):
         """Test publishing large number of events."""
-        from core.event_bus import EventBus
         import time
         
-        bus = EventBus(test_project_name)
-        
         start = time.time()
         for i in range(1000):
             bus.publish(
@@ -235,13 +207,11 @@ class TestEventBusPerformance:
         # Buffer should respect max size (default 100)
         assert len(bus.buffer) <= 100
     
-    def test_get_recent_performance(self, test_project_name):
+    @pytest.mark.slow
+    def test_get_recent_performance(self, bus):
         """Test performance of get_recent with full buffer."""
-        from core.event_bus import EventBus
         import time
         
-        bus = EventBus(test_project_name)
-        
         # Fill buffer
         for i in range(100):
             bus.publish(
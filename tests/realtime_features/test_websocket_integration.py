@@ -6,19 +6,22 @@ Tests how WebSocketManager and EventBus work together, matching actual implement
 
 import pytest
 import time
-from pathlib import Path
-import sys
 from unittest.mock import patch, Mock
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
+from agents.base_agent import AgentBase
 from tests.fixtures.websocket_fixtures import (
     test_project_name,
     test_project_dir
 )
 
 
+class _TestAgent(AgentBase):
+    """Minimal concrete agent for exercising AgentBase messaging."""
+    
+    def run(self, **kwargs):
+        pass
+
+
 @pytest.mark.integration
 class TestWebSocketEventBusIntegration:
     """Test WebSocket and EventBus integration."""
@@ -71,16 +74,11 @@ class TestEventBusAuditLogIntegration:
         """Test that AgentBase has send_message method."""
         from core.event_bus import EventBus
         from core.audit_log import AuditLog
-        from agents.base_agent import AgentBase
         
         event_bus = EventBus(test_project_name)
         audit_log = AuditLog(test_project_name)
         
-        class TestAgent(AgentBase):
-            def run(self, **kwargs):
-                pass
-        
-        agent = TestAgent(
+        agent = _TestAgent(
             name="TestAgent",
             project_name=test_project_name,
             event_bus=event_bus,
@@ -155,7 +153,7 @@ class TestConcurrencyIntegration:
     def test_concurrent_publishes_from_multiple_agents(self, test_project_name):
         """Test multiple agents publishing simultaneously."""
         from core.event_bus import EventBus
-        import threading
+        from concurrent.futures import ThreadPoolExecutor
         
         bus = EventBus(test_project_name)
         
@@ -168,19 +166,9 @@ class TestConcurrencyIntegration:
                     payload={"index": i}
                 )
         
-        # Create threads for different agents
-        threads = [
-            threading.Thread(target=publish_events, args=(f"Agent{i}", 10))
-            for i in range(5)
-        ]
-        
-        # Start all threads
-        for t in threads:
-            t.start()
-        
-        # Wait for completion
-        for t in threads:
-            t.join()
+        # Publish from 5 agents concurrently; consuming map() re-raises errors
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(lambda i: publish_events(f"Agent{i}", 10), range(5)))
         
         # All events should be published (though may be truncated by buffer)
         assert len(bus.buffer) > 0
@@ -196,16 +184,11 @@ class TestEndToEndMessageFlow:
         """Test complete flow: Agent → EventBus → (WebSocket)."""
         from core.event_bus import EventBus
         from core.audit_log import AuditLog
-        from agents.base_agent import AgentBase
         
         event_bus = EventBus(test_project_name)
         audit_log = AuditLog(test_project_name)
         
-        class TestAgent(AgentBase):
-            def run(self, **kwargs):
-                pass
-        
-        agent = TestAgent(
+        agent = _TestAgent(
             name="TestAgent",
             project_name=test_project_name,
             event_bus=event_bus,
@@ -5,15 +5,9 @@ Tests WebSocket server functionality matching the actual implementation.
 """
 
 import pytest
-import time
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from tests.fixtures.websocket_fixtures import test_project_name
+from tests.fixtures.websocket_fixtures import test_project_name, ws_manager
 
 
 class TestWebSocketManagerCore:
@@ -68,47 +62,32 @@ class TestWebSocketManagerCore:
 class TestWebSocketManagerServerLifecycle:
     """Test WebSocket server start/stop lifecycle."""
     
-    def test_start_server(self):
+    def test_start_server(self, ws_manager):
         """Test starting WebSocket server."""
-        from core.websocket_manager import WEBSOCKET_MANAGER
-        
-        # Start server (may already be running)
-        WEBSOCKET_MANAGER.start_server()
+        # Started once by the session fixture (may already be running)
+        ws_manager.start_server()
         
-        # Give it time to start
-        time.sleep(0.5)
-        
-        # Either it's running now, or was already running
+        # Either it's running now, or the port was already taken
         # Both are acceptable
-        assert True  # Server started or already running
+        assert ws_manager.server_thread is not None
     
-    def test_server_running_flag(self):
+    def test_server_running_flag(self, ws_manager):
         """Test that running flag is set appropriately."""
-        from core.websocket_manager import WEBSOCKET_MANAGER
-        
-        # After start_server, running should eventually be True
-        WEBSOCKET_MANAGER.start_server()
-        time.sleep(1)
-        
         # May be True if server started successfully
         # Test that attribute exists
-        assert hasattr(WEBSOCKET_MANAGER, 'running')
+        assert hasattr(ws_manager, 'running')
 
 
 class TestWebSocketManagerThreading:
     """Test threading behavior of WebSocketManager."""
     
-    def test_has_server_thread_attribute(self):
+    def test_has_server_thread_attribute(self, ws_manager):
         """Test that manager has server_thread attribute."""
-        from core.websocket_manager import WEBSOCKET_MANAGER
-        
-        assert hasattr(WEBSOCKET_MANAGER, 'server_thread')
+        assert hasattr(ws_manager, 'server_thread')
     
-    def test_has_loop_attribute(self):
+    def test_has_loop_attribute(self, ws_manager):
         """Test that manager has event loop attribute."""
-        from core.websocket_manager import WEBSOCKET_MANAGER
-        
-        assert hasattr(WEBSOCKET_MANAGER, 'loop')
+        assert hasattr(ws_manager, 'loop')
 
 
 if __name__ == "__main__":
@@ -1,171 +1,234 @@
-import json
+import asyncio
+import functools
+import os
+import sys
 import traceback
 from datetime import datetime
-from playwright.sync_api import sync_playwright
+from pathlib import Path
+import orjson
+from playwright.async_api import async_playwright
 from utils import (
     reset_default_project,
     wait_for_text,
     wait_for_no_errors,
-    wait_for_streamlit_to_start,
-    wait_for_streamlit_to_finish,
+    wait_section,
 )
 
 
 REPORT_PATH = "tests/test_report.json"
+STREAMLIT_URL = "http://localhost:8501"
+SAMPLE_INPUTS_PATH = Path("tests/test_data/sample_inputs.json")
+
+# Headless Chromium without GPU init; the smoke test only reads text labels
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--single-process",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+# Resource types never needed to find text labels
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+@functools.lru_cache(maxsize=1)
+def load_sample_inputs():
+    """Reads and parses the sample inputs once per process."""
+    return orjson.loads(SAMPLE_INPUTS_PATH.read_bytes())
 
 
 def write_report(report):
     """Writes the JSON test report to disk."""
-    with open(REPORT_PATH, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    with open(REPORT_PATH, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
 
-def wait_for_any_label(page, labels, timeout=60000):
+async def block_heavy_assets(route):
     """
-    Waits for ANY of the provided text labels to appear.
+    Aborts image/font/media requests and lets everything else through.
     """
-    for label in labels:
-        try:
-            wait_for_text(page, label, timeout=timeout)
-            return label
-        except Exception:
-            continue
-    raise TimeoutError(f"None of the expected labels appeared: {labels}")
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-def run_smoke_test():
-    # Initialize report structure
-    report = {
-        "timestamp": datetime.now().isoformat(),
-        "status": "passed",
-        "results": {
-            "Plot Architect": "pending",
-            "Worldbuilder": "pending",
-            "Character Agent": "pending",
-            "Scene Pipeline": "pending",
-            "Story Bible Pipeline": "pending",
-            "Intelligence Panel": "pending",
-            "Memory Browser": "pending",
-        },
-        "error": None,
-    }
+async def open_page(playwright):
+    """
+    Launches headless Chromium and opens one page in a fresh context.
 
-    # Reset default project before starting
-    reset_default_project()
+    Returns:
+        (browser, page) tuple; the caller closes the browser
+    """
+    browser = await playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+    context = await browser.new_context()
+    await context.route("**/*", block_heavy_assets)
+    page = await context.new_page()
+    return browser, page
 
-    with open("tests/test_data/sample_inputs.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
+async def open_studio(page):
+    """Loads the Streamlit UI and waits for the title."""
+    await page.goto(STREAMLIT_URL)
 
-        try:
-            print("Opening Streamlit UI...")
-            page.goto("http://localhost:8501")
+    await wait_for_text(page, "PinkBison Creative Studio")
+    await wait_for_no_errors(page)
 
-            wait_for_text(page, "PinkBison Creative Studio")
-            wait_for_no_errors(page)
 
-            # -----------------------------
-            # Plot Architect
-            # -----------------------------
-            print("Testing Plot Architect...")
-            page.fill("textarea[aria-label='Seed idea for the Plot Architect']", data["plot_seed"])
-            page.click("text=Generate 3‑Act Outline")
+class StudioLocators:
+    """
+    Locators for the studio page, built once and reused by every section.
 
-            wait_for_streamlit_to_start(page)
-            wait_for_streamlit_to_finish(page)
+    Buttons resolve through the accessibility tree (get_by_role) rather
+    than re-parsing "text=..." selectors on each click.
+    """
 
-            wait_for_text(page, "3‑Act Outline")
-            wait_for_no_errors(page)
-            report["results"]["Plot Architect"] = "passed"
+    def __init__(self, page):
+        self.page = page
 
-            # -----------------------------
-            # Worldbuilder
-            # -----------------------------
-            print("Testing Worldbuilder...")
-            page.fill("textarea[aria-label='Outline for Worldbuilder']", data["world_outline"])
-            page.click("text=Generate World Bible")
+        # Plot Architect
+        self.plot_seed = page.get_by_label("Seed idea for the Plot Architect")
+        self.generate_outline = page.get_by_role("button", name="Generate 3‑Act Outline")
 
-            wait_for_streamlit_to_start(page)
-            wait_for_streamlit_to_finish(page)
+        # Worldbuilder
+        self.world_outline = page.get_by_label("Outline for Worldbuilder")
+        self.generate_world = page.get_by_role("button", name="Generate World Bible")
 
-            wait_for_text(page, "World Bible")
-            wait_for_no_errors(page)
-            report["results"]["Worldbuilder"] = "passed"
+        # Character Agent
+        self.character_outline = page.get_by_label("Outline for Character Agent")
+        self.character_world_notes = page.get_by_label("World notes for Character Agent")
+        self.generate_characters = page.get_by_role("button", name="Generate Character Bible")
 
-            # -----------------------------
-            # Character Agent
-            # -----------------------------
-            print("Testing Character Agent...")
-            page.fill("textarea[aria-label='Outline for Character Agent']", data["character_outline"])
-            page.fill("textarea[aria-label='World notes for Character Agent']", data["character_world_notes"])
-            page.click("text=Generate Character Bible")
+        # Scene Pipeline
+        self.scene_prompt = page.get_by_label("Scene goal / prompt")
+        self.scene_outline_snippet = page.get_by_label("Relevant outline snippet")
+        self.scene_world_notes = page.get_by_label("World notes for scene")
+        self.scene_character_notes = page.get_by_label("Character notes for scene")
+        self.generate_scene = page.get_by_role("button", name="Generate Scene Pipeline")
 
-            wait_for_streamlit_to_start(page)
-            wait_for_streamlit_to_finish(page)
+        # Story Bible Pipeline
+        self.pipeline_seed = page.get_by_label("Seed idea for full story bible pipeline")
+        self.run_story_bible = page.get_by_role("button", name="Run Story Bible Pipeline")
 
-            wait_for_text(page, "Character Bible")
-            wait_for_no_errors(page)
-            report["results"]["Character Agent"] = "passed"
+        # Expanders
+        self.intelligence_panel = page.get_by_text("Project Intelligence Panel").first
+        self.memory_browser = page.get_by_text("Memory Browser").first
 
-            # -----------------------------
-            # Scene Pipeline
-            # -----------------------------
-            print("Testing Scene Pipeline...")
-            page.fill("textarea[aria-label='Scene goal / prompt']", data["scene_prompt"])
-            page.fill("textarea[aria-label='Relevant outline snippet']", data["scene_outline_snippet"])
-            page.fill("textarea[aria-label='World notes for scene']", data["scene_world_notes"])
-            page.fill("textarea[aria-label='Character notes for scene']", data["scene_character_notes"])
-            page.click("text=Generate Scene Pipeline")
 
-            wait_for_streamlit_to_start(page)
-            wait_for_streamlit_to_finish(page)
+# -----------------------------
+# Sections
+# -----------------------------
 
-            page.wait_for_selector("text=Raw", timeout=30000)
-            wait_for_no_errors(page)
-            report["results"]["Scene Pipeline"] = "passed"
+async def plot_architect_section(ui, data):
+    page = ui.page
+    await ui.plot_seed.fill(data["plot_seed"])
+    await ui.generate_outline.click()
 
-            # -----------------------------
-            # Story Bible Pipeline
-            # -----------------------------
-            print("Testing Story Bible Pipeline...")
-            page.fill("textarea[aria-label='Seed idea for full story bible pipeline']", data["pipeline_seed"])
-            page.click("text=Run Story Bible Pipeline")
+    await wait_section(page, "3‑Act Outline")
+    await wait_for_no_errors(page)
 
-            wait_for_streamlit_to_start(page)
-            wait_for_streamlit_to_finish(page)
 
-            # Robust fallback: accept ANY of these labels
-            wait_for_any_label(
-                page,
-                labels=["Pipeline Output", "Story Bible", "Output"],
-                timeout=60000,
-            )
+async def worldbuilder_section(ui, data):
+    page = ui.page
+    await ui.world_outline.fill(data["world_outline"])
+    await ui.generate_world.click()
 
-            wait_for_no_errors(page)
-            report["results"]["Story Bible Pipeline"] = "passed"
+    await wait_section(page, "World Bible")
+    await wait_for_no_errors(page)
 
-            # -----------------------------
-            # Intelligence Panel (NO SPINNER)
-            # -----------------------------
-            print("Checking Intelligence Panel...")
-            page.click("text=Project Intelligence Panel")
 
-            wait_for_text(page, "Task Queue", timeout=30000)
-            wait_for_no_errors(page)
+async def character_agent_section(ui, data):
+    page = ui.page
+    await ui.character_outline.fill(data["character_outline"])
+    await ui.character_world_notes.fill(data["character_world_notes"])
+    await ui.generate_characters.click()
 
-            report["results"]["Intelligence Panel"] = "passed"
+    await wait_section(page, "Character Bible")
+    await wait_for_no_errors(page)
 
-            # -----------------------------
-            # Memory Browser (NO SPINNER)
-            # -----------------------------
-            print("Checking Memory Browser...")
-            page.click("text=Memory Browser")
 
-            wait_for_no_errors(page)
-            report["results"]["Memory Browser"] = "passed"
+async def scene_pipeline_section(ui, data):
+    page = ui.page
+    await ui.scene_prompt.fill(data["scene_prompt"])
+    await ui.scene_outline_snippet.fill(data["scene_outline_snippet"])
+    await ui.scene_world_notes.fill(data["scene_world_notes"])
+    await ui.scene_character_notes.fill(data["scene_character_notes"])
+    await ui.generate_scene.click()
+
+    await wait_section(page, "Raw")
+    await wait_for_no_errors(page)
+
+
+async def story_bible_pipeline_section(ui, data):
+    page = ui.page
+    await ui.pipeline_seed.fill(data["pipeline_seed"])
+    await ui.run_story_bible.click()
+
+    # Robust fallback: accept ANY of these labels
+    await wait_section(page, ["Pipeline Output", "Story Bible", "Output"])
+
+    await wait_for_no_errors(page)
+
+
+async def intelligence_panel_section(ui, data):
+    # NO SPINNER
+    await ui.intelligence_panel.click()
+
+    await wait_for_text(ui.page, "Task Queue", timeout=30000)
+    await wait_for_no_errors(ui.page)
+
+
+async def memory_browser_section(ui, data):
+    # NO SPINNER
+    await ui.memory_browser.click()
+
+    await wait_for_no_errors(ui.page)
+
+
+# Report name -> section coroutine, in the order they must run
+SECTIONS = [
+    ("Plot Architect", plot_architect_section),
+    ("Worldbuilder", worldbuilder_section),
+    ("Character Agent", character_agent_section),
+    ("Scene Pipeline", scene_pipeline_section),
+    ("Story Bible Pipeline", story_bible_pipeline_section),
+    ("Intelligence Panel", intelligence_panel_section),
+    ("Memory Browser", memory_browser_section),
+]
+
+
+async def run_smoke_test():
+    """
+    Runs every UI section against a single page in one browser context.
+
+    Returns:
+        Process exit code (0 on success, 1 on failure)
+    """
+    # Initialize report structure
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "status": "passed",
+        "results": {name: "pending" for name, _ in SECTIONS},
+        "error": None,
+    }
+
+    # Reset default project before starting
+    reset_default_project()
+
+    data = load_sample_inputs()
+
+    async with async_playwright() as p:
+        browser, page = await open_page(p)
+
+        try:
+            print("Opening Streamlit UI...")
+            await open_studio(page)
+
+            ui = StudioLocators(page)
+            for name, section in SECTIONS:
+                print(f"Testing {name}...")
+                await section(ui, data)
+                report["results"][name] = "passed"
 
             # -----------------------------
             # SUCCESS
@@ -204,28 +267,30 @@ def run_smoke_test():
             }
 
             # Save screenshot
-            page.screenshot(path="tests/failure.png")
+            await page.screenshot(path="tests/failure.png")
+            print("Saved: tests/failure.png")
 
-            # Save HTML snapshot
-            with open("tests/failure_snapshot.html", "w", encoding="utf-8") as f:
-                f.write(page.content())
+            # Save HTML snapshot (set DEBUG=1 to enable)
+            if os.environ.get("DEBUG"):
+                with open("tests/failure_snapshot.html", "w", encoding="utf-8") as f:
+                    f.write(await page.content())
+                print("Saved: tests/failure_snapshot.html")
 
-            print("Saved: tests/failure.png and tests/failure_snapshot.html")
             print("Full traceback:")
             traceback.print_exc()
 
             write_report(report)
-            browser.close()
+            await browser.close()
             reset_default_project()
-            exit(1)
+            return 1
 
         # Cleanup on success
         write_report(report)
-        browser.close()
+        await browser.close()
         reset_default_project()
         print("Default project cleaned. Test complete.")
-        exit(0)
+        return 0
 
 
 if __name__ == "__main__":
-    run_smoke_test()
+    sys.exit(asyncio.run(run_smoke_test()))
@@ -3,10 +3,10 @@ Test real-time workflow features.
 """
 
 import asyncio
-import time
 import threading
 import pytest
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 from core.feedback_manager import FeedbackManager, FeedbackType, FeedbackPriority
 from core.pipeline_controller import PipelineController, PipelineStatus
@@ -21,18 +21,20 @@ class TestRealTimeFeatures:
         return FeedbackManager("test_project")
     
     @pytest.fixture
-    def pipeline_controller(self):
+    def pipeline_controller(self, monkeypatch):
         """Create a PipelineController for testing."""
-        # Mock registry components
-        with patch('core.pipeline_controller.REGISTRY') as mock_registry:
-            mock_event_bus = Mock()
-            mock_audit_log = Mock()
-            
-            mock_registry.get_event_bus.return_value = mock_event_bus
-            mock_registry.get_audit_log.return_value = mock_audit_log
-            
-            controller = PipelineController("test_project")
-            return controller
+        # Stub registry components with plain objects (monkeypatch undoes this)
+        fake_event_bus = SimpleNamespace(publish=lambda *args, **kwargs: None)
+        fake_audit_log = SimpleNamespace(append=lambda *args, **kwargs: None)
+        fake_registry = SimpleNamespace(
+            get_event_bus=lambda project_name: fake_event_bus,
+            get_audit_log=lambda project_name: fake_audit_log,
+        )
+        monkeypatch.setattr(
+            "core.pipeline_controller.REGISTRY", fake_registry, raising=False
+        )
+        
+        return PipelineController("test_project")
     
     def test_feedback_manager_basics(self, feedback_manager):
         """Test basic FeedbackManager operations."""
@@ -62,6 +64,61 @@ class TestRealTimeFeatures:
         assert stats["processed"] == 1
         assert stats["unprocessed"] == 0
     
+    def test_feedback_grouped_by_agent(self, feedback_manager):
+        """Test bulk grouping matches per-agent lookups."""
+        for agent, priority in [("plot_architect", FeedbackPriority.HIGH),
+                                ("plot_architect", FeedbackPriority.LOW),
+                                ("worldbuilder", FeedbackPriority.NORMAL),
+                                ("ALL", FeedbackPriority.NORMAL)]:
+            feedback_manager.add_feedback(
+                target_agent=agent,
+                feedback_type=FeedbackType.GUIDANCE,
+                content=f"{agent} {priority.name}",
+                priority=priority
+            )
+        processed_id = feedback_manager.add_feedback(
+            target_agent="worldbuilder",
+            feedback_type=FeedbackType.GUIDANCE,
+            content="already handled"
+        )
+        feedback_manager.mark_as_processed(processed_id)
+
+        grouped = feedback_manager.get_unprocessed_grouped_by_agent()
+
+        assert set(grouped) == {"plot_architect", "worldbuilder", "ALL"}
+        for agent, messages in grouped.items():
+            expected = feedback_manager.get_feedback_for_agent(
+                agent_name=agent,
+                include_broadcast=False,
+                unprocessed_only=True
+            )
+            assert [m.id for m in messages] == [m.id for m in expected]
+
+    def test_feedback_add_and_publish(self, feedback_manager):
+        """Test feedback is stored at once and published in the background."""
+        published = threading.Event()
+        calls = []
+
+        def publish(**kwargs):
+            calls.append(kwargs)
+            published.set()
+
+        fb_id = feedback_manager.add_and_publish(
+            SimpleNamespace(publish=publish),
+            target_agent="worldbuilder",
+            feedback_type=FeedbackType.CANON,
+            content="Magic has a cost",
+            priority=FeedbackPriority.HIGH
+        )
+
+        feedback = feedback_manager.get_feedback_for_agent("worldbuilder")
+        assert [f.id for f in feedback] == [fb_id]
+
+        assert published.wait(timeout=2.0)
+        assert calls[0]["event_type"] == "user_feedback_canon"
+        assert calls[0]["recipient"] == "worldbuilder"
+        assert calls[0]["payload"]["feedback_id"] == fb_id
+
     def test_feedback_manager_thread_safety(self, feedback_manager):
         """Test thread safety of FeedbackManager."""
         results = []
@@ -76,16 +133,9 @@ class TestRealTimeFeatures:
                 )
                 results.append(fb_id)
         
-        # Create multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=add_feedback_thread, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        # Add feedback from 5 workers concurrently; consuming map() re-raises errors
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(add_feedback_thread, range(5)))
         
         # Verify no data corruption
         stats = feedback_manager.get_stats()
@@ -98,27 +148,28 @@ class TestRealTimeFeatures:
         """Test PipelineController status management."""
         assert pipeline_controller.status == PipelineStatus.IDLE
         
-        # Mock pipeline function
-        async def mock_pipeline(**kwargs):
-            await asyncio.sleep(0.1)
+        # Mock pipeline function (blocks until the test releases it)
+        release = threading.Event()
+        
+        def mock_pipeline(controller, feedback_manager, **kwargs):
+            release.wait(timeout=2.0)
             return {"result": "test"}
         
         # Start pipeline
-        pipeline_id = pipeline_controller.start_pipeline(
+        started = pipeline_controller.start_pipeline(
             pipeline_func=mock_pipeline,
-            pipeline_type="test",
-            pipeline_args={}
+            task_name="test",
+            total_steps=3
         )
         
-        assert pipeline_id is not None
+        assert started is True
         assert pipeline_controller.status == PipelineStatus.RUNNING
         
         # Update progress
         pipeline_controller.update_progress(
-            current_step="test_step",
             step_number=1,
-            total_steps=3,
-            description="Testing progress"
+            current_step="test_step",
+            step_description="Testing progress"
         )
         
         # Check progress
@@ -127,38 +178,36 @@ class TestRealTimeFeatures:
         assert status["progress"]["percent_complete"] > 0
         
         # Pause and resume
-        assert pipeline_controller.pause_pipeline() == True
+        assert pipeline_controller.pause() == True
         assert pipeline_controller.status == PipelineStatus.PAUSED
         
-        assert pipeline_controller.resume_pipeline() == True
+        assert pipeline_controller.resume() == True
         assert pipeline_controller.status == PipelineStatus.RUNNING
         
         # Stop
-        assert pipeline_controller.stop_pipeline() == True
+        assert pipeline_controller.stop() == True
         assert pipeline_controller.status == PipelineStatus.STOPPED
+        
+        release.set()
     
     @pytest.mark.asyncio
     async def test_async_pipeline_execution(self, pipeline_controller):
         """Test async pipeline execution."""
         execution_steps = []
         
-        async def test_pipeline(**kwargs):
+        async def test_pipeline(controller, feedback_manager, **kwargs):
             execution_steps.append("start")
             
             # Simulate work with pause checks
             for i in range(3):
-                pipeline_controller.update_progress(
-                    current_step=f"step_{i}",
+                controller.update_progress(
                     step_number=i + 1,
-                    total_steps=3,
-                    description=f"Processing step {i}"
+                    current_step=f"step_{i}",
+                    step_description=f"Processing step {i}"
                 )
                 
-                # Check for pause
-                pipeline_controller.wait_if_paused()
-                
-                # Check for stop
-                if pipeline_controller.should_stop():
+                # Check for pause / stop
+                if not controller.wait_for_resume():
                     return {"status": "stopped"}
                 
                 await asyncio.sleep(0.01)
@@ -167,15 +216,20 @@ class TestRealTimeFeatures:
             execution_steps.append("complete")
             return {"status": "complete"}
         
-        # Start pipeline
-        pipeline_id = pipeline_controller.start_pipeline(
-            pipeline_func=test_pipeline,
-            pipeline_type="test_async",
-            pipeline_args={}
+        # Start pipeline (the controller thread runs the coroutine to completion)
+        started = pipeline_controller.start_pipeline(
+            pipeline_func=lambda **kwargs: asyncio.run(test_pipeline(**kwargs)),
+            task_name="test_async",
+            total_steps=3
         )
+        assert started is True
         
-        # Wait for completion
-        time.sleep(0.5)
+        # Await completion (returns as soon as the pipeline finishes)
+        result = await asyncio.wait_for(
+            asyncio.wrap_future(pipeline_controller.pipeline_future),
+            timeout=2.0
+        )
+        assert result == {"status": "complete"}
         
         # Check execution steps
         assert "start" in execution_steps
@@ -0,0 +1,83 @@
+"""
+Per-section performance budgets for the Streamlit smoke test.
+
+Runs the sections from tests/smoke_test.py one at a time under the
+pytest-performance ``performance`` fixture, so a slowdown is reported
+against the section that regressed rather than only as total wall time.
+
+Requires the Streamlit UI on localhost:8501 and the model servers:
+    pytest tests/test_smoke_perf.py --runslow
+"""
+
+import asyncio
+import pytest
+
+pytest.importorskip("playwright.async_api")
+pytest.importorskip("pytest_performance")
+
+from playwright.async_api import async_playwright
+from smoke_test import (
+    SECTIONS,
+    StudioLocators,
+    load_sample_inputs,
+    open_page,
+    open_studio,
+)
+from utils import reset_default_project
+
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.requires_ui,
+    pytest.mark.requires_model,
+]
+
+# Budget per section, in seconds
+SECTION_BUDGETS = {
+    "Plot Architect": 15,
+    "Worldbuilder": 15,
+    "Character Agent": 15,
+    "Scene Pipeline": 30,
+    "Story Bible Pipeline": 60,
+    "Intelligence Panel": 5,
+    "Memory Browser": 5,
+}
+
+
+@pytest.fixture(scope="module")
+def studio_page():
+    """
+    Open one Streamlit page shared by every section in this module.
+
+    Sections build on each other's state, so they run in SECTIONS order
+    against the same page, driven by a dedicated event loop.
+
+    Yields:
+        (event_loop, StudioLocators) tuple
+    """
+    reset_default_project()
+    loop = asyncio.new_event_loop()
+    playwright = loop.run_until_complete(async_playwright().start())
+    browser, page = loop.run_until_complete(open_page(playwright))
+    loop.run_until_complete(open_studio(page))
+
+    yield loop, StudioLocators(page)
+
+    loop.run_until_complete(browser.close())
+    loop.run_until_complete(playwright.stop())
+    loop.close()
+    reset_default_project()
+
+
+@pytest.mark.parametrize("name, section", SECTIONS, ids=[name for name, _ in SECTIONS])
+def test_section_within_budget(studio_page, performance, name, section):
+    """Each smoke-test section finishes within its time budget."""
+    loop, ui = studio_page
+    data = load_sample_inputs()
+
+    def run_section():
+        loop.run_until_complete(section(ui, data))
+    run_section.__name__ = section.__name__
+
+    # One iteration: sections call the model and mutate project state
+    performance(run_section, target=SECTION_BUDGETS[name], unit="s", iterations=1)
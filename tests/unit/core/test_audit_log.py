@@ -0,0 +1,146 @@
+"""
+Test AuditLog functionality.
+"""
+
+import pytest
+from core.audit_log import AuditLog
+
+
+class TestAuditLog:
+    """Test AuditLog class"""
+
+    @pytest.fixture
+    def audit_log(self, tmp_path):
+        """Fresh audit log in a temporary base directory"""
+        return AuditLog("test_audit_project", base_dir=str(tmp_path))
+
+    def test_version_bumps_on_append(self, audit_log, tmp_path):
+        """Verify version changes on every append, from any instance"""
+        empty = audit_log.version
+
+        audit_log.append("partial_result", "producer", "ui", {"step": "outline"})
+        first = audit_log.version
+        assert first != empty
+
+        other = AuditLog("test_audit_project", base_dir=str(tmp_path))
+        other.append("partial_result", "producer", "ui", {"step": "world"})
+        assert audit_log.version != first
+        assert audit_log.version == other.version
+
+    def test_version_bumps_on_clear(self, audit_log):
+        """Verify clear invalidates cached readers"""
+        audit_log.append("task_update", "producer", "ui", {})
+        before = audit_log.version
+
+        audit_log.clear()
+
+        assert audit_log.version != before
+        assert audit_log.search() == []
+
+    def test_search_by_event_type_and_step(self, audit_log):
+        """Verify indexed search filters by type and step, in log order"""
+        audit_log.append("partial_result", "producer", "ui", {"step": "outline", "content": "a"})
+        audit_log.append("task_update", "producer", "ui", {"step": "outline"})
+        audit_log.append("partial_result", "producer", "ui", {"step": "scene", "content": "b"})
+        audit_log.append("partial_result", "worldbuilder", "ui", {"step": "world", "content": "c"})
+
+        results = audit_log.search(event_type="partial_result", step_in=("outline", "world"))
+        assert [r.payload["content"] for r in results] == ["a", "c"]
+
+        results = audit_log.search(event_type="partial_result", sender="worldbuilder")
+        assert [r.payload["content"] for r in results] == ["c"]
+
+        assert len(audit_log.search(event_type="partial_result", limit=2)) == 2
+
+    def test_search_sees_entries_from_other_instances(self, audit_log, tmp_path):
+        """Verify the index picks up lines appended by another AuditLog"""
+        assert audit_log.search(event_type="feedback") == []
+
+        other = AuditLog("test_audit_project", base_dir=str(tmp_path))
+        other.append("feedback", "user", "plot_architect", {"text": "more tension"})
+
+        results = audit_log.search(event_type="feedback")
+        assert len(results) == 1
+        assert results[0].payload["text"] == "more tension"
+
+    def test_concurrent_refresh_indexes_each_line_once(self, audit_log, tmp_path):
+        """Verify concurrent searches on a shared instance don't double-index lines"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        writer = AuditLog("test_audit_project", base_dir=str(tmp_path))
+        for i in range(2000):
+            writer.append("partial_result", "producer", "ui", {"n": i})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            counts = list(pool.map(lambda _: audit_log.count("partial_result"), range(8)))
+
+        assert counts == [2000] * 8
+        assert len(audit_log.search(event_type="partial_result")) == 2000
+
+    def test_count_by_event_type(self, audit_log):
+        """Verify count uses the index and tracks appends"""
+        assert audit_log.count("partial_result") == 0
+
+        audit_log.append("partial_result", "producer", "ui", {"step": "outline"})
+        audit_log.append("task_update", "producer", "ui", {})
+
+        assert audit_log.count("partial_result") == 1
+        assert audit_log.count("task_update") == 1
+        assert audit_log.count() == 2
+
+    def test_search_offset_pages_results(self, audit_log):
+        """Verify offset/limit page through matches in log order"""
+        for i in range(5):
+            audit_log.append("partial_result", "producer" if i % 2 else "editor", "ui", {"n": i})
+            audit_log.append("task_update", "producer", "ui", {"n": i})
+
+        page = audit_log.search(event_type="partial_result", limit=2, offset=2)
+        assert [r.payload["n"] for r in page] == [2, 3]
+
+        page = audit_log.search(event_type="partial_result", sender="producer", limit=1, offset=1)
+        assert [r.payload["n"] for r in page] == [3]
+
+        page = audit_log.search(limit=3, offset=8)
+        assert [r.payload["n"] for r in page] == [4, 4]
+
+    def test_sender_contains_filters_paging_and_count(self, audit_log):
+        """Verify sender substring filter applies before offset and in count"""
+        for i in range(6):
+            audit_log.append("agent_message", "plot_architect" if i % 2 else "editor_agent", "ui", {"n": i})
+
+        assert audit_log.count("agent_message", sender_contains="PLOT") == 3
+        assert audit_log.count(sender_contains="agent") == 3
+
+        page = audit_log.search(event_type="agent_message", sender_contains="plot", limit=2, offset=1)
+        assert [r.payload["n"] for r in page] == [3, 5]
+
+    def test_full_text_search(self, audit_log):
+        """Verify q matches every word across sender, recipient and payload"""
+        audit_log.append("agent_message", "plot_architect", "ui", {"content": "The Dragon wakes"})
+        audit_log.append("agent_message", "worldbuilder", "ui", {"content": "A dragon-free valley"})
+        audit_log.append("task_update", "producer", "plot_architect", {"content": "dragon chapter done"})
+
+        assert [r.sender for r in audit_log.search(q="dragon")] == ["plot_architect", "worldbuilder", "producer"]
+        assert [r.sender for r in audit_log.search(q="DRAGON plot_architect")] == ["plot_architect", "producer"]
+        assert [r.sender for r in audit_log.search(event_type="task_update", q="dragon")] == ["producer"]
+        assert audit_log.search(q="griffin") == []
+        assert audit_log.search(q="content") == []  # payload keys aren't indexed
+        assert audit_log.count(q="dragon") == 3
+        assert audit_log.count("agent_message", q="valley") == 1
+
+        # Index picks up new lines and resets on clear
+        audit_log.append("agent_message", "editor_agent", "ui", {"content": "griffin"})
+        assert len(audit_log.search(q="griffin")) == 1
+        audit_log.clear()
+        assert audit_log.search(q="dragon") == []
+
+    def test_search_iter_is_lazy(self, audit_log):
+        """Verify search_iter yields matches one at a time, like search"""
+        for i in range(3):
+            audit_log.append("agent_message", "producer", "ui", {"n": i})
+
+        entries = audit_log.search_iter(event_type="agent_message", limit=2)
+        assert next(entries).payload["n"] == 0
+        assert [e.payload["n"] for e in entries] == [1]
+        assert audit_log.search(event_type="agent_message", limit=2, offset=1) == \
+            list(audit_log.search_iter(event_type="agent_message", limit=2, offset=1))
@@ -0,0 +1,34 @@
+"""
+Test EventBus functionality.
+"""
+
+import pytest
+from core.event_bus import EventBus
+
+
+class TestEventBus:
+    """Test EventBus class"""
+
+    @pytest.fixture
+    def event_bus(self):
+        """Small ring buffer so tests exercise wrap-around"""
+        return EventBus("test_event_bus_project", buffer_size=5)
+
+    def _publish(self, event_bus, count):
+        for i in range(count):
+            event_bus.publish("producer", "ALL" if i % 2 else "editor_agent", "step", {"n": i})
+
+    def test_tail_returns_newest_in_order(self, event_bus):
+        """Verify tail returns the last n events, oldest first"""
+        self._publish(event_bus, 8)
+
+        assert [e.payload["n"] for e in event_bus.tail(3)] == [5, 6, 7]
+        assert [e.payload["n"] for e in event_bus.tail(50)] == [3, 4, 5, 6, 7]
+        assert event_bus.tail(0) == []
+
+    def test_get_recent_filters_tail(self, event_bus):
+        """Verify get_recent keeps broadcast and addressed events"""
+        self._publish(event_bus, 4)
+
+        assert [e.payload["n"] for e in event_bus.get_recent("editor_agent", limit=3)] == [1, 2, 3]
+        assert [e.payload["n"] for e in event_bus.get_recent("worldbuilder", limit=3)] == [1, 3]
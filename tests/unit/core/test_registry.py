@@ -111,4 +111,27 @@ class TestProjectRegistry:
         # Should be different instances
         assert bus1 is not bus2
         assert bus1.project_name == "project_a"
-        assert bus2.project_name == "project_b"
\ No newline at end of file
+        assert bus2.project_name == "project_b"
+    
+    def test_is_pipeline_active_without_controller(self):
+        """Verify idle check doesn't construct a controller"""
+        self.registry.clear_project(self.test_project)
+        
+        assert self.registry.is_pipeline_active(self.test_project) is False
+        assert f"pipeline_controller_{self.test_project}" not in self.registry._instances
+    
+    def test_is_pipeline_active_reads_status(self):
+        """Verify running and paused controllers count as active"""
+        from core.pipeline_controller import PipelineStatus
+        
+        controller = self.registry.get_pipeline_controller(self.test_project)
+        try:
+            assert self.registry.is_pipeline_active(self.test_project) is False
+            
+            controller.status = PipelineStatus.RUNNING
+            assert self.registry.is_pipeline_active(self.test_project) is True
+            
+            controller.status = PipelineStatus.PAUSED
+            assert self.registry.is_pipeline_active(self.test_project) is True
+        finally:
+            self.registry.clear_project(self.test_project)
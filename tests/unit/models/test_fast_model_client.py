@@ -0,0 +1,30 @@
+"""
+Test fast model client streaming.
+"""
+
+from unittest.mock import MagicMock, patch
+from models.fast_model_client import chat_fast_stream
+
+
+class TestChatFastStream:
+    """Test chat_fast_stream function"""
+
+    @patch('models.fast_model_client.requests.post')
+    def test_yields_content_deltas(self, mock_post):
+        """Verify SSE deltas are yielded in order until [DONE]"""
+        mock_response = MagicMock()
+        mock_response.iter_lines.return_value = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b'',
+            b'data: {"choices": [{"delta": {"content": "Once"}}]}',
+            b'data: {"choices": [{"delta": {"content": " upon"}}]}',
+            b'data: [DONE]',
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+        ]
+        mock_post.return_value.__enter__.return_value = mock_response
+
+        chunks = list(chat_fast_stream([{"role": "user", "content": "Test"}]))
+
+        assert chunks == ["Once", " upon"]
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+        assert mock_post.call_args.kwargs["stream"] is True
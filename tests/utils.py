@@ -12,41 +12,66 @@ def reset_default_project():
             json.dump({}, f, indent=2)
 
 
-def wait_for_text(page, text, timeout=60000):
+async def wait_for_text(page, text, timeout=60000):
     """
     Waits for text to appear anywhere on the page.
     """
-    page.wait_for_selector(f"text={text}", timeout=timeout)
+    await page.get_by_text(text).first.wait_for(timeout=timeout)
 
 
-def wait_for_no_errors(page):
+async def wait_for_no_errors(page):
     """
     Ensures no Streamlit red error boxes are visible.
     """
-    errors = page.query_selector_all("div.stAlert")
+    errors = await page.query_selector_all("div.stAlert")
     if errors:
         raise AssertionError("Streamlit error box detected on page.")
 
 
-def wait_for_streamlit_to_start(page, timeout=30000):
+async def wait_for_streamlit_to_start(page, timeout=30000):
     """
     Waits for Streamlit's running spinner to appear.
     This indicates that a callback has started.
     """
-    page.wait_for_selector(
+    await page.wait_for_selector(
         '[data-testid="stStatusWidgetRunningIcon"]',
         state="attached",
         timeout=timeout
     )
 
 
-def wait_for_streamlit_to_finish(page, timeout=600000):
+async def wait_for_streamlit_to_finish(page, timeout=600000):
     """
     Waits for Streamlit's running spinner to disappear.
     This indicates that the callback has fully completed.
     """
-    page.wait_for_selector(
+    await page.wait_for_selector(
         '[data-testid="stStatusWidgetRunningIcon"]',
         state="detached",
         timeout=timeout
     )
+
+
+# True once the run icon is gone AND any of the texts is on the page
+_SECTION_DONE_JS = """
+(texts) => !document.querySelector('[data-testid="stStatusWidgetRunningIcon"]')
+    && texts.some((t) => document.body.innerText.includes(t))
+"""
+
+
+async def wait_section(page, final_text, timeout=600000):
+    """
+    Waits for a section's callback to finish and its output to render.
+
+    Waits for the run to start (the button labels often contain the
+    final text, so it must not match before the callback runs), then
+    covers finish + wait_for_text with a single page-side poll.
+
+    Args:
+        page: Playwright page
+        final_text: Text (or list of alternative texts) that marks the output
+        timeout: Max wait in ms (defaults to the old finish budget)
+    """
+    texts = [final_text] if isinstance(final_text, str) else list(final_text)
+    await wait_for_streamlit_to_start(page)
+    await page.wait_for_function(_SECTION_DONE_JS, arg=texts, timeout=timeout)
@@ -2,33 +2,53 @@
 Canon Rules UI - View and manage canon rules from GraphStore
 """
 
+import orjson
 import streamlit as st
 from core.registry import REGISTRY
 
+# Rule expanders rendered per page
+RULES_PAGE_SIZE = 50
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_canon_rules(project_name: str) -> list:
+    """Canon rules for a project, cached briefly so search reruns skip the graph read."""
+    return REGISTRY.get_graph_store(project_name).get_canon_rules()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _lowercase_rules(rule_texts: tuple) -> list:
+    """Lowercased rule texts for search, cached across reruns."""
+    return [text.lower() for text in rule_texts]
+
 
 def render_canon_rules(project_name: str):
     """Render canon rules viewer and manager"""
     st.header("📜 Canon Rules")
     
     graph = REGISTRY.get_graph_store(project_name)
-    canon_rules = graph.get_canon_rules()
+    canon_rules = _cached_canon_rules(project_name)
     
     if not canon_rules:
         st.info("No canon rules yet. Run Director Mode to generate canon rules.")
         return
     
+    # Group rules by source in one pass (feeds stats, options and filter)
+    rules_by_source = {}
+    for r in canon_rules:
+        rules_by_source.setdefault(r.get('source', 'Unknown'), []).append(r)
+    
     # Summary stats
     col1, col2 = st.columns(2)
     with col1:
         st.metric("Total Rules", len(canon_rules))
     with col2:
-        sources = set(r.get('source', 'Unknown') for r in canon_rules)
-        st.metric("Unique Sources", len(sources))
+        st.metric("Unique Sources", len(rules_by_source))
     
     st.markdown("---")
     
     # Filter options
-    all_sources = sorted(set(r.get('source', 'Unknown') for r in canon_rules))
+    all_sources = sorted(rules_by_source)
     filter_source = st.selectbox("Filter by Source", ["All"] + all_sources, key="canon_rules_filter")
     
     # Search
@@ -38,16 +58,25 @@ def render_canon_rules(project_name: str):
     filtered_rules = canon_rules
     
     if filter_source != "All":
-        filtered_rules = [r for r in filtered_rules if r.get('source', 'Unknown') == filter_source]
+        filtered_rules = rules_by_source.get(filter_source, [])
     
     if search:
         search_lower = search.lower()
-        filtered_rules = [r for r in filtered_rules if search_lower in r.get('rule', '').lower()]
+        lowered = _lowercase_rules(tuple(r.get('rule', '') for r in filtered_rules))
+        filtered_rules = [r for r, text in zip(filtered_rules, lowered) if search_lower in text]
     
     st.write(f"Showing {len(filtered_rules)} / {len(canon_rules)} rules")
     
+    # Paginate so only one page of expanders is sent per rerun
+    page_count = max(1, -(-len(filtered_rules) // RULES_PAGE_SIZE))
+    page_num = 1
+    if page_count > 1:
+        page_num = st.number_input("Page", min_value=1, max_value=page_count,
+                                   value=1, step=1, key="canon_rules_page")
+    start = (page_num - 1) * RULES_PAGE_SIZE
+    
     # Display rules
-    for idx, rule in enumerate(filtered_rules):
+    for idx, rule in enumerate(filtered_rules[start:start + RULES_PAGE_SIZE], start=start):
         rule_text = rule.get('rule', '')
         source = rule.get('source', 'Unknown')
         confidence = rule.get('confidence', 'N/A')
@@ -78,12 +107,11 @@ def render_canon_rules(project_name: str):
     
     with col1:
         st.markdown("**Export Rules**")
-        if st.button("Download as JSON"):
-            import json
-            rules_json = json.dumps(canon_rules, indent=2, ensure_ascii=False)
-            st.download_button("Download JSON", rules_json,
-                             file_name=f"{project_name}_canon_rules.json",
-                             mime="application/json")
+        # Serialized lazily, only when the button is clicked
+        st.download_button("Download as JSON",
+                         lambda: orjson.dumps(canon_rules, option=orjson.OPT_INDENT_2),
+                         file_name=f"{project_name}_canon_rules.json",
+                         mime="application/json")
     
     with col2:
         st.markdown("**Clear All Rules**")
@@ -92,6 +120,7 @@ def render_canon_rules(project_name: str):
             raw_graph = graph.get_raw_graph()
             raw_graph['canon_rules'] = []
             graph.replace_graph(raw_graph)
+            _cached_canon_rules.clear()
             st.success("All canon rules cleared!")
             st.rerun()
     
@@ -108,6 +137,7 @@ def render_canon_rules(project_name: str):
         if st.button("Add Rule"):
             if new_rule.strip():
                 graph.add_canon_rule(rule=new_rule.strip(), source=new_source, confidence=1.0)
+                _cached_canon_rules.clear()
                 st.success("Canon rule added!")
                 st.rerun()
             else:
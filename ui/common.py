@@ -9,12 +9,51 @@ from agents.producer import ProducerAgent
 from core.registry import REGISTRY
 from config.settings import MODEL_CONFIG
 
+# Feedback target agents -> display labels ("ALL" broadcasts to every agent)
+AGENT_LABELS = {
+    "ALL": "🎯 All Agents (Broadcast)",
+    "plot_architect": "📝 Plot Architect",
+    "worldbuilder": "🌍 Worldbuilder",
+    "character_agent": "👤 Character Agent",
+    "scene_generator": "🎬 Scene Generator",
+    "continuity_agent": "🔍 Continuity Agent",
+    "editor_agent": "✏️ Editor Agent",
+    "creative_director": "🎨 Creative Director",
+    "producer": "🎬 Producer",
+}
+
+# Feedback target agents, in display order
+AGENTS = tuple(AGENT_LABELS)
+
+# ProducerAgent model modes
+MODEL_MODES = ("fast", "high_quality")
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _build_producer(project_name: str, model_mode: str) -> ProducerAgent:
+    """
+    Construct a ProducerAgent wired to the project's Registry infrastructure.
+    
+    Cached as a Streamlit resource per (project_name, model_mode), so
+    reruns and sessions share one instance instead of rebuilding it. The
+    agent holds no per-user state, so sharing across sessions is safe.
+    """
+    return ProducerAgent(
+        project_name=project_name,
+        event_bus=REGISTRY.get_event_bus(project_name),
+        audit_log=REGISTRY.get_audit_log(project_name),
+        fast_model_url=MODEL_CONFIG.fast_model_url,
+        model_mode=model_mode,
+    )
+
 
 def get_producer(project_name: str, model_mode: str = "fast") -> ProducerAgent:
     """
     Get or create ProducerAgent for current project.
     
-    Now uses Registry for infrastructure management.
+    Now uses Registry for infrastructure management. Instances are cached
+    per project and model mode, so switching back to a project reuses its
+    existing producer.
     
     Args:
         project_name: Name of the project
@@ -27,25 +66,15 @@ def get_producer(project_name: str, model_mode: str = "fast") -> ProducerAgent:
         >>> producer = get_producer("my_project")
         >>> result = producer.run_story_bible_pipeline(...)
     """
-    # Check if we need to create/recreate
-    needs_create = (
-        "producer" not in st.session_state or
-        st.session_state.get("_producer_project") != project_name
-    )
-    
-    if needs_create:
-        # Get infrastructure from registry (creates if needed)
-        event_bus = REGISTRY.get_event_bus(project_name)
-        audit_log = REGISTRY.get_audit_log(project_name)
-        
-        # Create ProducerAgent
-        st.session_state["producer"] = ProducerAgent(
-            project_name=project_name,
-            event_bus=event_bus,
-            audit_log=audit_log,
-            fast_model_url=MODEL_CONFIG.fast_model_url,
-            model_mode=model_mode,
-        )
-        st.session_state["_producer_project"] = project_name
+    return _build_producer(project_name, model_mode)
+
+
+def clear_producer(project_name: str) -> None:
+    """
+    Drop the cached producers for a project, in every model mode.
     
-    return st.session_state["producer"]
\ No newline at end of file
+    Call alongside REGISTRY.clear_project(), since cached producers hold
+    the project's old event bus and audit log.
+    """
+    for model_mode in MODEL_MODES:
+        _build_producer.clear(project_name, model_mode)
@@ -2,13 +2,41 @@
 Real-time output display - updates via EventBus subscription
 """
 
+import json
+import logging
 import streamlit as st
+import streamlit.components.v1 as components
 from datetime import datetime
 from core.registry import REGISTRY
 
+# Pipeline steps shown in the live Story Bible panel
+PARTIAL_STEPS = ("outline", "world", "characters")
 
-def render_realtime_output(project_name: str):
-    """Display outputs via AuditLog (persistent)"""
+# (step, expander title, widget key) for the polled Story Bible panel
+_SECTIONS = (
+    ("outline", "📝 Outline", "o"),
+    ("world", "🌍 World", "w"),
+    ("characters", "👥 Characters", "c"),
+)
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_partial_search(project_name: str, version: tuple) -> list:
+    """partial_result entries, re-read from disk only when the log version changes"""
+    audit_log = REGISTRY.get_audit_log(project_name)
+    return audit_log.search(event_type="partial_result", limit=50,
+                            step_in=PARTIAL_STEPS)
+
+
+def _sync_partial_from_audit_log(project_name: str) -> dict:
+    """Fold new partial_result entries from the AuditLog into session state"""
+    audit_log = REGISTRY.get_audit_log(project_name)
+    
+    # Fresh project: nothing to fold in, leave session state untouched
+    if audit_log.count(event_type="partial_result") == 0:
+        return st.session_state.get(f"partial_{project_name}", {})
     
     if f"partial_{project_name}" not in st.session_state:
         st.session_state[f"partial_{project_name}"] = {
@@ -18,26 +46,176 @@ def render_realtime_output(project_name: str):
     partial = st.session_state[f"partial_{project_name}"]
     
     # Read from AuditLog instead of EventBus buffer
-    audit_log = REGISTRY.get_audit_log(project_name)
-    recent = audit_log.search(event_type="partial_result", limit=50)
+    version = audit_log.version
+    recent = _cached_partial_search(project_name, version)
+    
+    logger.debug("Found %d partial_result events in audit log", len(recent))
     
-    st.write(f"DEBUG: Found {len(recent)} partial_result events in audit log")
+    # Nothing appended since the last rerun: skip the state update
+    version_key = f"partial_version_{project_name}"
+    if st.session_state.get(version_key) != version:
+        st.session_state[version_key] = version
+        # Digest per step; duplicate partial_result entries leave state untouched
+        partial_hashes = st.session_state.setdefault(f"partial_hash_{project_name}", {})
+        for entry in recent:
+            step = entry.payload.get("step")
+            content = entry.payload.get("content")
+            
+            if content:
+                digest = hash(content)
+                if partial_hashes.get(step) != digest:
+                    partial_hashes[step] = digest
+                    partial[step] = content
+                    logger.debug("Updated %s from audit log", step)
     
-    updated = False
-    for entry in recent:
-        step = entry.payload.get("step")
-        content = entry.payload.get("content")
-        
-        if step in ["outline", "world", "characters"] and content:
-            if partial.get(step) != content:
-                partial[step] = content
-                updated = True
-                st.write(f"DEBUG: Updated {step} from audit log")
+    logger.debug("State = outline:%s, world:%s, characters:%s",
+                 bool(partial.get('outline')), bool(partial.get('world')),
+                 bool(partial.get('characters')))
+    
+    return partial
+
+
+def render_realtime_output(project_name: str):
+    """
+    Display live Story Bible outputs.
     
-    st.write(f"DEBUG: State = outline:{bool(partial.get('outline'))}, world:{bool(partial.get('world'))}, characters:{bool(partial.get('characters'))}")
+    When the WebSocket server is up, partial results are pushed straight
+    into the browser and the AuditLog is read only once per full rerun.
+    Otherwise falls back to polling the AuditLog from a fragment.
+    """
+    try:
+        from core.websocket_manager import WEBSOCKET_MANAGER
+        streaming = WEBSOCKET_MANAGER.running
+    except ImportError:
+        streaming = False
     
-    if updated:
-        st.rerun()
+    if streaming:
+        _render_streamed_output(project_name)
+    else:
+        _render_polled_output(project_name)
+
+
+def _render_streamed_output(project_name: str):
+    """Seed from the AuditLog, then update in the browser from WebSocket partial_result events"""
+    partial = _sync_partial_from_audit_log(project_name)
+    
+    # Escape "</" so outputs can't close the script tag
+    initial = json.dumps(
+        {step: partial.get(step) for step in PARTIAL_STEPS}
+    ).replace("</", "<\\/")
+    
+    html_code = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body {{
+                font-family: 'Source Sans Pro', sans-serif;
+                background: transparent;
+                color: #fafafa;
+                margin: 0;
+            }}
+            h3 {{ margin: 0 0 0.5rem 0; }}
+            .section {{ display: none; margin-bottom: 0.75rem; }}
+            .section-title {{ font-weight: 600; margin-bottom: 0.25rem; }}
+            textarea {{
+                width: 100%;
+                height: 200px;
+                box-sizing: border-box;
+                background: rgba(255, 255, 255, 0.05);
+                color: #fafafa;
+                border: 1px solid rgba(250, 250, 250, 0.2);
+                border-radius: 4px;
+                font-family: inherit;
+                resize: vertical;
+            }}
+            .placeholder {{
+                padding: 0.75rem 1rem;
+                border-radius: 4px;
+                background: rgba(28, 131, 225, 0.1);
+                color: #c7ebff;
+            }}
+        </style>
+    </head>
+    <body>
+        <div id="placeholder" class="placeholder">💡 Run a pipeline above to see outputs here</div>
+        <h3 id="title" style="display: none;">📋 Story Bible - Live</h3>
+        <div id="section-outline" class="section">
+            <div class="section-title">📝 Outline</div>
+            <textarea id="text-outline" readonly></textarea>
+        </div>
+        <div id="section-world" class="section">
+            <div class="section-title">🌍 World</div>
+            <textarea id="text-world" readonly></textarea>
+        </div>
+        <div id="section-characters" class="section">
+            <div class="section-title">👥 Characters</div>
+            <textarea id="text-characters" readonly></textarea>
+        </div>
+
+        <script>
+            const projectName = {json.dumps(project_name)};
+            let reconnectAttempts = 0;
+
+            function updatePartial(step, content) {{
+                const text = document.getElementById('text-' + step);
+                if (!text || !content) return;
+                text.value = content;
+                document.getElementById('section-' + step).style.display = 'block';
+                document.getElementById('title').style.display = 'block';
+                document.getElementById('placeholder').style.display = 'none';
+            }}
+
+            function connect() {{
+                const ws = new WebSocket('ws://localhost:8765');
+
+                ws.onopen = () => {{
+                    reconnectAttempts = 0;
+                    ws.send(JSON.stringify({{
+                        action: 'subscribe',
+                        project: projectName
+                    }}));
+                }};
+
+                ws.onmessage = (event) => {{
+                    try {{
+                        const data = JSON.parse(event.data);
+                        if (data.type === 'eventbus_message' &&
+                                data.data.event_type === 'partial_result') {{
+                            const payload = data.data.payload || {{}};
+                            updatePartial(payload.step, payload.content);
+                        }}
+                    }} catch (error) {{
+                        console.error('[RealtimeOutput] Error:', error);
+                    }}
+                }};
+
+                ws.onclose = () => {{
+                    if (reconnectAttempts < 5) {{
+                        reconnectAttempts++;
+                        setTimeout(connect, Math.min(1000 * Math.pow(2, reconnectAttempts), 30000));
+                    }}
+                }};
+            }}
+
+            const initial = {initial};
+            for (const step in initial) {{
+                updatePartial(step, initial[step]);
+            }}
+
+            connect();
+        </script>
+    </body>
+    </html>
+    """
+    
+    components.html(html_code, height=720, scrolling=True)
+
+
+@st.fragment(run_every="2s")
+def _render_polled_output(project_name: str):
+    """Display outputs via AuditLog (persistent); refreshes on its own every 2s"""
+    partial = _sync_partial_from_audit_log(project_name)
     
     if not any(partial.values()):
         st.info("💡 Run a pipeline above to see outputs here")
@@ -45,17 +223,11 @@ def render_realtime_output(project_name: str):
     
     st.subheader("📋 Story Bible - Live")
     
-    if partial.get("outline"):
-        with st.expander("📝 Outline", expanded=True):
-            st.text_area("", partial["outline"], height=200, key="o", disabled=True, label_visibility="collapsed")
-    
-    if partial.get("world"):
-        with st.expander("🌍 World", expanded=True):
-            st.text_area("", partial["world"], height=200, key="w", disabled=True, label_visibility="collapsed")
-    
-    if partial.get("characters"):
-        with st.expander("👥 Characters", expanded=True):
-            st.text_area("", partial["characters"], height=200, key="c", disabled=True, label_visibility="collapsed")
+    for step, title, key in _SECTIONS:
+        if partial.get(step):
+            with st.expander(title, expanded=True):
+                st.text_area("", partial[step], height=200, key=key, disabled=True, label_visibility="collapsed")
+
 
 def clear_partial_results(project_name: str):
     """Clear when starting new pipeline"""
@@ -63,4 +235,6 @@ def clear_partial_results(project_name: str):
         "outline": None,
         "world": None,
         "characters": None
-    }
\ No newline at end of file
+    }
+    st.session_state.pop(f"partial_version_{project_name}", None)
+    st.session_state.pop(f"partial_hash_{project_name}", None)
\ No newline at end of file
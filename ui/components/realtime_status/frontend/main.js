@@ -1,191 +1,185 @@
 // Real-Time Status Component with WebSocket
-class RealtimeStatus {
-    constructor() {
-        this.ws = null;
-        this.projectName = null;
-        this.reconnectAttempts = 0;
-        this.maxReconnectAttempts = 5;
-        this.reconnectDelay = 1000;
-    }
-
-    // Connect to WebSocket server
-    connect(projectName) {
-        this.projectName = projectName;
-        
-        console.log('[RealtimeStatus] Connecting to ws://localhost:8765');
-        this.ws = new WebSocket('ws://localhost:8765');
-
-        this.ws.onopen = () => {
-            console.log('[RealtimeStatus] Connected successfully');
-            this.reconnectAttempts = 0;
-            this.updateConnectionStatus(true);
-            
-            // Subscribe to project events
-            this.ws.send(JSON.stringify({
-                action: 'subscribe',
-                project: this.projectName
-            }));
-        };
-
-        this.ws.onmessage = (event) => {
-            try {
-                const data = JSON.parse(event.data);
-                this.handleMessage(data);
-            } catch (error) {
-                console.error('[RealtimeStatus] Parse error:', error);
+// Static bundle: Streamlit serves it once and the browser caches it;
+// only the project_name arg changes between renders.
+let projectName = null;
+let ws = null;
+let reconnectAttempts = 0;
+
+function connect() {
+    console.log('[RealtimeStatus] Connecting...');
+    ws = new WebSocket('ws://localhost:8765');
+
+    ws.onopen = () => {
+        console.log('[RealtimeStatus] Connected');
+        reconnectAttempts = 0;
+        document.getElementById('connection').className = 'connection-status connected';
+        document.getElementById('connection').textContent = '🟢 Connected';
+
+        ws.send(JSON.stringify({
+            action: 'subscribe',
+            project: projectName
+        }));
+    };
+
+    ws.onmessage = (event) => {
+        try {
+            const data = JSON.parse(event.data);
+
+            if (data.type === 'pipeline_status') {
+                updateStatus(data.data);
+            } else if (data.type === 'pipeline_progress') {
+                queueProgress(data.data);
+            } else if (data.type === 'eventbus_message') {
+                queueEvent(data.data);
             }
-        };
-
-        this.ws.onerror = (error) => {
-            console.error('[RealtimeStatus] WebSocket error:', error);
-            this.updateConnectionStatus(false);
-        };
-
-        this.ws.onclose = () => {
-            console.log('[RealtimeStatus] Connection closed');
-            this.updateConnectionStatus(false);
-            this.attemptReconnect();
-        };
-    }
-
-    // Handle incoming WebSocket messages
-    handleMessage(data) {
-        switch(data.type) {
-            case 'pipeline_status':
-                this.updatePipelineStatus(data.data);
-                break;
-            case 'pipeline_progress':
-                this.updateProgress(data.data);
-                break;
-            case 'eventbus_message':
-                this.addEvent(data.data);
-                break;
-            default:
-                console.log('[RealtimeStatus] Unknown message:', data.type);
+        } catch (error) {
+            console.error('[RealtimeStatus] Error:', error);
         }
-    }
+    };
 
-    // Update pipeline status badge
-    updatePipelineStatus(status) {
-        const badge = document.getElementById('status-badge');
-        if (badge) {
-            badge.textContent = status.status.toUpperCase();
-            badge.className = `status-badge status-${status.status}`;
-        }
+    ws.onerror = () => {
+        document.getElementById('connection').className = 'connection-status disconnected';
+        document.getElementById('connection').textContent = '🔴 Disconnected';
+    };
 
-        const task = document.getElementById('current-task');
-        if (task && status.current_task) {
-            task.textContent = status.current_task;
-            task.style.display = 'block';
-        } else if (task) {
-            task.style.display = 'none';
-        }
+    ws.onclose = () => {
+        document.getElementById('connection').className = 'connection-status disconnected';
+        document.getElementById('connection').textContent = '🔴 Disconnected';
 
-        // Show/hide progress section
-        const progressSection = document.getElementById('progress-section');
-        if (progressSection) {
-            progressSection.style.display = 
-                (status.status === 'running') ? 'block' : 'none';
+        if (reconnectAttempts < 5) {
+            reconnectAttempts++;
+            setTimeout(connect, Math.min(1000 * Math.pow(2, reconnectAttempts), 30000));
         }
-    }
+    };
+}
 
-    // Update progress bar
-    updateProgress(progress) {
-        const bar = document.getElementById('progress-bar');
-        if (bar) {
-            bar.style.width = Math.round(progress.percent_complete) + '%';
-        }
+function updateStatus(status) {
+    const badge = document.getElementById('status-badge');
+    badge.textContent = status.status.toUpperCase();
+    badge.className = 'status-badge status-' + status.status;
 
-        const text = document.getElementById('progress-text');
-        if (text) {
-            text.textContent = 
-                `${progress.current_step} - ` +
-                `Step ${progress.step_number}/${progress.total_steps} ` +
-                `(${Math.round(progress.percent_complete)}%)`;
-        }
-    }
+    const progressContainer = document.getElementById('progress-container');
+    progressContainer.style.display = (status.status === 'running') ? 'block' : 'none';
+}
 
-    // Add event to live stream
-    addEvent(event) {
-        const stream = document.getElementById('event-stream');
-        if (!stream) return;
-
-        const eventDiv = document.createElement('div');
-        eventDiv.className = 'event-item';
-        
-        const time = new Date().toLocaleTimeString();
-        eventDiv.innerHTML = `
-            <span class="event-time">${time}</span>
-            <span class="event-sender">${event.sender}</span>
-            <span class="event-arrow">→</span>
-            <span class="event-recipient">${event.recipient}</span>
-            <span class="event-type">${event.event_type}</span>
-        `;
-
-        // Insert at top
-        stream.insertBefore(eventDiv, stream.firstChild);
-
-        // Keep only last 50 events
-        while (stream.children.length > 50) {
-            stream.removeChild(stream.lastChild);
-        }
-    }
+function updateProgress(progress) {
+    const fill = document.getElementById('progress-fill');
+    fill.style.width = Math.round(progress.percent_complete) + '%';
 
-    // Update connection indicator
-    updateConnectionStatus(connected) {
-        const indicator = document.getElementById('connection-status');
-        if (indicator) {
-            if (connected) {
-                indicator.textContent = '🟢 Connected';
-                indicator.className = 'connection-status connected';
-            } else {
-                indicator.textContent = '🔴 Disconnected';
-                indicator.className = 'connection-status disconnected';
-            }
-        }
-    }
+    const text = document.getElementById('progress-text');
+    text.textContent = progress.current_step + ' - Step ' + 
+        progress.step_number + '/' + progress.total_steps + 
+        ' (' + Math.round(progress.percent_complete) + '%)';
+}
+
+// Bursts of progress/events are coalesced into one DOM update per frame
+let pendingProgress = null;
+let pendingEvents = [];
+let frameScheduled = false;
 
-    // Attempt to reconnect with exponential backoff
-    attemptReconnect() {
-        if (this.reconnectAttempts >= this.maxReconnectAttempts) {
-            console.error('[RealtimeStatus] Max reconnect attempts reached');
-            return;
+function scheduleFlush() {
+    if (frameScheduled) return;
+    frameScheduled = true;
+    requestAnimationFrame(() => {
+        frameScheduled = false;
+
+        if (pendingProgress) {
+            updateProgress(pendingProgress);
+            pendingProgress = null;
         }
 
-        this.reconnectAttempts++;
-        const delay = Math.min(
-            this.reconnectDelay * Math.pow(2, this.reconnectAttempts),
-            30000  // Max 30 seconds
-        );
+        // queueEvent keeps at most MAX_EVENTS, the newest
+        const events = pendingEvents;
+        pendingEvents = [];
+        events.forEach(addEvent);
+    });
+}
+
+function queueProgress(progress) {
+    pendingProgress = progress;
+    scheduleFlush();
+}
+
+function queueEvent(event) {
+    pendingEvents.push(event);
+    // Background tabs pause requestAnimationFrame; keep only what can be shown
+    if (pendingEvents.length > MAX_EVENTS) {
+        pendingEvents.splice(0, pendingEvents.length - MAX_EVENTS);
+    }
+    scheduleFlush();
+}
 
-        console.log(`[RealtimeStatus] Reconnecting in ${delay}ms...`);
-        setTimeout(() => this.connect(this.projectName), delay);
+// Live events ring buffer: a fixed pool of nodes, recycled oldest-first.
+// CSS order puts the newest on top without moving nodes in the DOM.
+const MAX_EVENTS = 50;
+const eventPool = [];
+let eventHead = 0;
+
+function buildEventPool() {
+    const stream = document.getElementById('events-stream');
+    for (let i = 0; i < MAX_EVENTS; i++) {
+        const item = document.createElement('div');
+        item.className = 'event-item empty';
+        item.innerHTML =
+            '<span class="event-time"></span> ' +
+            '<span class="event-sender"></span> ' +
+            '<span class="event-arrow">→</span> ' +
+            '<span class="event-recipient"></span> ' +
+            '<span class="event-type"></span>';
+        eventPool.push({
+            item: item,
+            time: item.querySelector('.event-time'),
+            sender: item.querySelector('.event-sender'),
+            recipient: item.querySelector('.event-recipient'),
+            type: item.querySelector('.event-type')
+        });
+        stream.appendChild(item);
     }
+}
 
-    // Disconnect and cleanup
-    disconnect() {
-        if (this.ws) {
-            this.ws.close();
-            this.ws = null;
+function addEvent(event) {
+    if (eventHead === 0) {
+        // Remove "waiting" message on the first event
+        const noEvents = document.querySelector('#events-stream .no-events');
+        if (noEvents) {
+            noEvents.remove();
         }
     }
+
+    const slot = eventPool[eventHead % MAX_EVENTS];
+    slot.time.textContent = new Date().toLocaleTimeString();
+    slot.sender.textContent = event.sender;
+    slot.recipient.textContent = event.recipient;
+    slot.type.textContent = event.event_type;
+    slot.item.style.order = -eventHead;
+    slot.item.classList.remove('empty');
+    eventHead++;
 }
 
-// Initialize global instance
-window.realtimeStatus = new RealtimeStatus();
+buildEventPool();
 
-// Streamlit component callbacks
-function onRender(event) {
-    const data = event.detail;
-    
-    // Connect if not already connected
-    if (data.project_name && !window.realtimeStatus.ws) {
-        window.realtimeStatus.connect(data.project_name);
-    }
+// Streamlit component protocol (plain JS, no streamlit-component-lib build)
+function sendToStreamlit(type, data) {
+    window.parent.postMessage(
+        Object.assign({ isStreamlitMessage: true, type: type }, data), '*'
+    );
 }
 
-function onUnmount() {
-    if (window.realtimeStatus) {
-        window.realtimeStatus.disconnect();
+window.addEventListener('message', (event) => {
+    if (!event.data || event.data.type !== 'streamlit:render') return;
+
+    // Reruns re-send the same args; only (re)connect when the project changes
+    const name = event.data.args.project_name;
+    if (name && name !== projectName) {
+        projectName = name;
+        reconnectAttempts = 0;
+        if (ws) {
+            ws.onclose = null;
+            ws.close();
+        }
+        connect();
     }
-}
\ No newline at end of file
+});
+
+sendToStreamlit('streamlit:componentReady', { apiVersion: 1 });
+sendToStreamlit('streamlit:setFrameHeight', { height: 350 });
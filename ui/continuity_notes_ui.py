@@ -5,13 +5,35 @@ Continuity Notes UI - View continuity check history
 import streamlit as st
 from core.project_state import ProjectState
 from datetime import datetime
+from functools import lru_cache
+
+# Note expanders rendered per page
+NOTES_PAGE_SIZE = 20
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _load_state(project_name: str, mtime_ns: int) -> ProjectState:
+    """ProjectState for a project, re-read only when its state file changes"""
+    return ProjectState.load(project_name)
+
+
+def _state_mtime_ns(project_name: str) -> int:
+    """State file modification time (0 if the project has no state file yet)"""
+    path = ProjectState.path_for(project_name)
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: str) -> str:
+    """ISO timestamp -> display string (notes keep their timestamps, so cache it)"""
+    return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def render_continuity_notes(project_name: str):
     """Render continuity notes viewer"""
     st.header("📋 Continuity Notes")
     
-    state = ProjectState.load(project_name)
+    state = _load_state(project_name, _state_mtime_ns(project_name))
     
     if not state.continuity_notes:
         st.info("No continuity notes yet. Run a pipeline with continuity checks enabled.")
@@ -29,18 +51,22 @@ def render_continuity_notes(project_name: str):
         """)
         return
     
+    # Group notes by source in one pass (feeds stats, options and filter)
+    notes_by_source = {}
+    for n in state.continuity_notes:
+        notes_by_source.setdefault(n.source, []).append(n)
+    
     # Summary stats
     col1, col2 = st.columns(2)
     with col1:
         st.metric("Total Notes", len(state.continuity_notes))
     with col2:
-        sources = set(n.source for n in state.continuity_notes)
-        st.metric("Sources", len(sources))
+        st.metric("Sources", len(notes_by_source))
     
     st.markdown("---")
     
     # Filter options
-    all_sources = sorted(set(n.source for n in state.continuity_notes))
+    all_sources = sorted(notes_by_source)
     filter_source = st.selectbox(
         "Filter by Source",
         ["All"] + all_sources,
@@ -51,14 +77,22 @@ def render_continuity_notes(project_name: str):
     if filter_source == "All":
         filtered_notes = state.continuity_notes
     else:
-        filtered_notes = [n for n in state.continuity_notes if n.source == filter_source]
+        filtered_notes = notes_by_source.get(filter_source, [])
     
     st.write(f"Showing {len(filtered_notes)} / {len(state.continuity_notes)} notes")
     
+    # Paginate so only one page of expanders is sent per rerun
+    page_count = max(1, -(-len(filtered_notes) // NOTES_PAGE_SIZE))
+    page_num = 1
+    if page_count > 1:
+        page_num = st.number_input("Page", min_value=1, max_value=page_count,
+                                   value=1, step=1, key="continuity_page")
+    start = (page_num - 1) * NOTES_PAGE_SIZE
+    newest_first = filtered_notes[::-1]
+    
     # Display notes in reverse chronological order
-    for idx, note in enumerate(reversed(filtered_notes)):
-        timestamp = datetime.fromisoformat(note.timestamp)
-        time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    for idx, note in enumerate(newest_first[start:start + NOTES_PAGE_SIZE], start=start):
+        time_str = _format_timestamp(note.timestamp)
         
         with st.expander(
             f"#{len(filtered_notes) - idx}: {note.source} - {time_str}",
@@ -77,5 +111,6 @@ def render_continuity_notes(project_name: str):
         if st.button("Clear Notes", type="secondary"):
             state.continuity_notes = []
             state.save()
+            _load_state.clear()
             st.success("Notes cleared!")
             st.rerun()
\ No newline at end of file
@@ -2,75 +2,94 @@
 UI for injecting feedback during pipeline execution.
 """
 
+import pandas as pd
 import streamlit as st
 from typing import List, Dict, Any
 
-from core.registry import REGISTRY
 from core.feedback_manager import FeedbackType, FeedbackPriority
+from core.registry import REGISTRY
+from ui.common import AGENTS, AGENT_LABELS
+
+# Selectbox / slider options, built once
+_FEEDBACK_TYPES = tuple(FeedbackType)
+_FEEDBACK_PRIORITIES = tuple(FeedbackPriority)
+
+# Display labels, precomputed per enum member
+_TITLE_BY_TYPE = {t: t.value.title() for t in FeedbackType}
+_LABEL_BY_PRIORITY = {p: f"{p.name} ({p.value})" for p in FeedbackPriority}
+
+
+def _set_template(key: str, text: str) -> None:
+    """Quick template button callback: fill the feedback text area"""
+    st.session_state[key] = text
+
+
+def _mark_processed_cb(feedback_manager, project_name: str, feedback_ids: List[str]) -> None:
+    """
+    Pending table callback: mark rows ticked as processed.
+    
+    The table key is rotated afterwards so the edit state (stored by row
+    position) doesn't carry over onto the shrunken table.
+    """
+    edits = st.session_state[_pending_table_key(project_name)]["edited_rows"]
+    for row, changes in edits.items():
+        if changes.get("processed"):
+            feedback_manager.mark_as_processed(feedback_ids[int(row)])
+    
+    gen_key = f"_fb_table_gen_{project_name}"
+    st.session_state[gen_key] = st.session_state.get(gen_key, 0) + 1
+
+
+def _pending_table_key(project_name: str) -> str:
+    """Widget key of the current pending feedback table"""
+    return f"fb_table_{project_name}_{st.session_state.get(f'_fb_table_gen_{project_name}', 0)}"
 
 
+def _clear_all_cb(feedback_manager, project_name: str) -> None:
+    """Clear All Processed button callback; the count is shown on the next run"""
+    st.session_state[f"_last_clear_count_{project_name}"] = feedback_manager.clear_processed()
+
+
+@st.fragment
 def render_feedback_injector(project_name: str):
     """
     Render feedback injection interface.
+    Runs as a fragment, so typing feedback doesn't re-run the whole app.
     """
     with st.expander("🎯 Inject Feedback", expanded=True):
         
-        # Get pipeline controller
-        pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
-        feedback_manager = pipeline_controller.feedback_manager
-        
-        # Current status
-        status = pipeline_controller.get_status()
-        
-        if not status["is_running"] and not status["is_paused"]:
+        # Idle check reads a status flag only (no controller lookup)
+        if not REGISTRY.is_pipeline_active(project_name):
             st.info("Start a pipeline to inject feedback")
             return
         
+        feedback_manager = REGISTRY.get_pipeline_controller(project_name).feedback_manager
+        
         # Target agent selection
         col1, col2 = st.columns(2)
         
         with col1:
             target_agent = st.selectbox(
                 "Target Agent",
-                options=[
-                    "ALL",
-                    "plot_architect",
-                    "worldbuilder",
-                    "character_agent",
-                    "scene_generator",
-                    "continuity_agent",
-                    "editor_agent",
-                    "creative_director",
-                    "producer"
-                ],
-                format_func=lambda x: {
-                    "ALL": "🎯 All Agents (Broadcast)",
-                    "plot_architect": "📝 Plot Architect",
-                    "worldbuilder": "🌍 Worldbuilder",
-                    "character_agent": "👤 Character Agent",
-                    "scene_generator": "🎬 Scene Generator",
-                    "continuity_agent": "🔍 Continuity Agent",
-                    "editor_agent": "✏️ Editor Agent",
-                    "creative_director": "🎨 Creative Director",
-                    "producer": "🎬 Producer"
-                }[x],
+                options=AGENTS,
+                format_func=AGENT_LABELS.__getitem__,
                 key=f"feedback_target_{project_name}"
             )
         
         with col2:
             feedback_type = st.selectbox(
                 "Feedback Type",
-                options=list(FeedbackType),
-                format_func=lambda x: x.value.title(),
+                options=_FEEDBACK_TYPES,
+                format_func=_TITLE_BY_TYPE.__getitem__,
                 key=f"feedback_type_{project_name}"
             )
         
         # Priority selection
         priority = st.select_slider(
             "Priority",
-            options=list(FeedbackPriority),
+            options=_FEEDBACK_PRIORITIES,
             value=FeedbackPriority.NORMAL,
-            format_func=lambda x: f"{x.name} ({x.value})",
+            format_func=_LABEL_BY_PRIORITY.__getitem__,
             key=f"feedback_priority_{project_name}"
         )
         
@@ -86,26 +105,26 @@ def render_feedback_injector(project_name: str):
         st.markdown("**Quick Templates:**")
         col1, col2, col3 = st.columns(3)
         
+        content_key = f"feedback_content_{project_name}"
+        
         with col1:
-            if st.button("More detail", use_container_width=True, key=f"template_detail_{project_name}"):
-                st.session_state[f"feedback_content_{project_name}"] = "Please add more detail and description here."
-                st.rerun()
+            st.button("More detail", use_container_width=True, key=f"template_detail_{project_name}",
+                      on_click=_set_template, args=(content_key, "Please add more detail and description here."))
         
         with col2:
-            if st.button("Simplify", use_container_width=True, key=f"template_simplify_{project_name}"):
-                st.session_state[f"feedback_content_{project_name}"] = "Please simplify and make it more accessible."
-                st.rerun()
+            st.button("Simplify", use_container_width=True, key=f"template_simplify_{project_name}",
+                      on_click=_set_template, args=(content_key, "Please simplify and make it more accessible."))
         
         with col3:
-            if st.button("Check canon", use_container_width=True, key=f"template_canon_{project_name}"):
-                st.session_state[f"feedback_content_{project_name}"] = "Please check this against established canon rules and ensure consistency."
-                st.rerun()
+            st.button("Check canon", use_container_width=True, key=f"template_canon_{project_name}",
+                      on_click=_set_template, args=(content_key, "Please check this against established canon rules and ensure consistency."))
         
         # Inject button
         if st.button("💬 Inject Feedback", type="primary", use_container_width=True, key=f"inject_btn_{project_name}"):
             if feedback_content.strip():
-                # Add feedback
-                feedback_id = feedback_manager.add_feedback(
+                # Add feedback and publish to EventBus for immediate visibility
+                feedback_manager.add_and_publish(
+                    REGISTRY.get_event_bus(project_name),
                     target_agent=target_agent,
                     feedback_type=feedback_type,
                     content=feedback_content.strip(),
@@ -113,19 +132,6 @@ def render_feedback_injector(project_name: str):
                     source="user"
                 )
                 
-                # Also publish to EventBus for immediate visibility
-                event_bus = REGISTRY.get_event_bus(project_name)
-                event_bus.publish(
-                    sender="user",
-                    recipient=target_agent,
-                    event_type=f"user_feedback_{feedback_type.value}",
-                    payload={
-                        "content": feedback_content.strip(),
-                        "priority": priority.value,
-                        "feedback_id": feedback_id
-                    }
-                )
-                
                 st.success(f"Feedback injected for {target_agent}")
                 
                 # Clear the text area
@@ -138,83 +144,49 @@ def render_feedback_injector(project_name: str):
         
         # Show pending feedback
         st.markdown("---")
-        st.markdown("### 📬 Pending Feedback")
-        
-        stats = feedback_manager.get_stats()
-        if stats["unprocessed"] > 0:
-            # Show feedback by agent
-            agents = ["ALL", "plot_architect", "worldbuilder", "character_agent",
-                     "scene_generator", "continuity_agent", "editor_agent",
-                     "creative_director", "producer"]
-            
-            for agent in agents:
-                feedback = feedback_manager.get_feedback_for_agent(
-                    agent_name=agent,
-                    include_broadcast=False,
-                    unprocessed_only=True
-                )
-                
-                if feedback:
-                    with st.expander(f"{agent} ({len(feedback)})", expanded=False):
-                        for msg in feedback:
-                            render_feedback_message(msg, feedback_manager, project_name)
-            
-            # Clear all button
-            if st.button("🗑️ Clear All Processed", type="secondary", key=f"clear_all_{project_name}"):
-                cleared = feedback_manager.clear_processed()
-                st.success(f"Cleared {cleared} processed messages")
-                st.rerun()
-        else:
-            st.info("No pending feedback")
+        _render_pending(project_name)
 
 
-def render_feedback_message(feedback, feedback_manager, project_name: str):
-    """
-    Render a single feedback message.
-    
-    Args:
-        feedback: FeedbackMessage object
-        feedback_manager: FeedbackManager instance
-        project_name: Project name for unique keys
+@st.fragment
+def _render_pending(project_name: str):
     """
-    # Priority colors
-    priority_colors = {
-        1: "#666666",  # LOW
-        2: "#44aa44",  # NORMAL
-        3: "#ffaa44",  # HIGH
-        4: "#ff4444",  # CRITICAL
-        5: "#ff0000",  # URGENT
-    }
-    
-    # Create message HTML
-    html = f"""
-    <div style="
-        border-left: 4px solid {priority_colors.get(feedback.priority.value, '#666666')};
-        padding: 10px;
-        margin: 5px 0;
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 4px;
-    ">
-        <div style="display: flex; justify-content: space-between; align-items: center;">
-            <div>
-                <strong>{feedback.feedback_type.value.title()}</strong>
-                <span style="color: #888; font-size: 0.9em; margin-left: 10px;">
-                    Priority: {feedback.priority.name}
-                </span>
-            </div>
-            <div style="color: #aaa; font-size: 0.8em;">
-                {feedback.created_at[11:19]}
-            </div>
-        </div>
-        <div style="margin-top: 8px;">
-            {feedback.content}
-        </div>
-    </div>
+    Pending feedback table, as a fragment so marking rows / Clear All
+    only re-run this list rather than the whole app.
     """
+    feedback_manager = REGISTRY.get_pipeline_controller(project_name).feedback_manager
     
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown("### 📬 Pending Feedback")
     
-    # Mark as processed button
-    if st.button("✅ Mark Processed", key=f"mark_processed_{feedback.id}_{project_name}"):
-        feedback_manager.mark_as_processed(feedback.id)
-        st.rerun()
\ No newline at end of file
+    stats = feedback_manager.get_stats()
+    if stats["unprocessed"] > 0:
+        # One table for all agents; tick "processed" to mark a message
+        grouped = feedback_manager.get_unprocessed_grouped_by_agent()
+        feedback = [msg for agent in AGENTS for msg in grouped.get(agent, [])]
+        
+        df = pd.DataFrame([{
+            "agent": msg.target_agent,
+            "type": _TITLE_BY_TYPE[msg.feedback_type],
+            "priority": msg.priority.name,
+            "time": msg.created_at[11:19],
+            "content": msg.content,
+            "processed": False,
+        } for msg in feedback])
+        
+        st.data_editor(
+            df,
+            disabled=["agent", "type", "priority", "time", "content"],
+            hide_index=True,
+            use_container_width=True,
+            key=_pending_table_key(project_name),
+            on_change=_mark_processed_cb,
+            args=(feedback_manager, project_name, [msg.id for msg in feedback])
+        )
+        
+        # Clear all button (callback runs before the automatic rerun)
+        st.button("🗑️ Clear All Processed", type="secondary", key=f"clear_all_{project_name}",
+                  on_click=_clear_all_cb, args=(feedback_manager, project_name))
+        cleared = st.session_state.pop(f"_last_clear_count_{project_name}", None)
+        if cleared is not None:
+            st.success(f"Cleared {cleared} processed messages")
+    else:
+        st.info("No pending feedback")
@@ -1,6 +1,7 @@
 import streamlit as st
-from models.fast_model_client import chat_fast
-from models.heavy_model import generate_with_heavy_model
+
+# Model clients are imported inside the button handlers: heavy_model pulls in
+# torch/transformers, which shouldn't load until a model is actually run.
 
 
 def render_general_playground(project_name):
@@ -17,9 +18,9 @@ def render_general_playground(project_name):
         if st.button("Run Fast Model (3B)"):
             prompt = st.session_state["general_prompt"].strip()
             if prompt:
-                result = chat_fast([{"role": "user", "content": prompt}])
+                from models.fast_model_client import chat_fast_stream
                 st.subheader("Fast Model Output")
-                st.write(result)
+                st.write_stream(chat_fast_stream([{"role": "user", "content": prompt}]))
             else:
                 st.info("Enter a prompt above to use the fast model.")
 
@@ -27,9 +28,9 @@ def render_general_playground(project_name):
         if st.button("Run Creative Model (7B)"):
             prompt = st.session_state["general_prompt"].strip()
             if prompt:
-                result = generate_with_heavy_model(prompt, max_new_tokens=300)
+                from models.heavy_model import stream_with_heavy_model
                 st.subheader("Creative Model Output")
-                st.write(result)
+                st.write_stream(stream_with_heavy_model(prompt, max_new_tokens=300))
             else:
                 st.info("Enter a prompt above to use the creative model.")
 
@@ -4,14 +4,33 @@ Ensures projects exist and are properly loaded.
 """
 
 import streamlit as st
+from typing import Any, Dict, Optional
 from project_manager.loader import project_exists, load_project_state, save_project_state
 from project_manager.state import load_state_into_session
 
 
+def _create_project(project_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Create a project on disk.
+    
+    Returns:
+        The new project's state, or None on error
+    """
+    try:
+        # Create the project by loading it (creates default if missing)
+        state = load_project_state(project_name)
+        save_project_state(project_name, state)
+        print(f"[Initialization] Created project: {project_name}")
+        return state
+    except Exception as e:
+        print(f"[Initialization] Failed to create project {project_name}: {e}")
+        return None
+
+
 def ensure_project_exists(project_name: str) -> bool:
     """
     Ensure a project exists on disk.
-    Creates it if missing.
+    Creates it if missing. Checked once per session per project.
     
     Args:
         project_name: Name of project to ensure exists
@@ -19,24 +38,21 @@ def ensure_project_exists(project_name: str) -> bool:
     Returns:
         True if project exists or was created, False on error
     """
-    if project_exists(project_name):
+    ensured = st.session_state.setdefault("_ensured_projects", set())
+    if project_name in ensured:
         return True
     
-    try:
-        # Create the project by loading it (creates default if missing)
-        state = load_project_state(project_name)
-        save_project_state(project_name, state)
-        print(f"[Initialization] Created project: {project_name}")
+    if project_exists(project_name) or _create_project(project_name) is not None:
+        ensured.add(project_name)
         return True
-    except Exception as e:
-        print(f"[Initialization] Failed to create project {project_name}: {e}")
-        return False
+    return False
 
 
 def initialize_ui() -> None:
     """
     Initialize the UI with proper project state.
-    Called at the start of studio_ui.py
+    Called at the start of studio_ui.py; loads from disk once per
+    session (and again only when the current project changes).
     """
     from project_manager.state import initialize_session_state
     
@@ -47,13 +63,22 @@ def initialize_ui() -> None:
     if "current_project" not in st.session_state:
         st.session_state["current_project"] = "default_project"
     
-    # Ensure the project exists on disk
     project_name = st.session_state["current_project"]
-    if ensure_project_exists(project_name):
-        # Load the project state into session
+    if st.session_state.get("_project_initialized") == project_name:
+        return
+    
+    # Ensure the project exists on disk, reading its state only once
+    if project_exists(project_name):
         state = load_project_state(project_name)
+    else:
+        state = _create_project(project_name)
+    
+    if state is not None:
+        # Load the project state into session
         load_state_into_session(state)
+        st.session_state.setdefault("_ensured_projects", set()).add(project_name)
+        st.session_state["_project_initialized"] = project_name
         print(f"[Initialization] Loaded project: {project_name}")
     else:
         print(f"[Initialization] Failed to initialize project: {project_name}")
-        # Fallback to empty session state
\ No newline at end of file
+        # Fallback to empty session state
@@ -3,8 +3,10 @@ Enhanced Intelligence Panel with real-time components.
 Integrates live event stream, feedback injection, and pipeline controls.
 """
 
+import orjson
 import streamlit as st
 from core.registry import REGISTRY
+from ui.common import AGENTS, AGENT_LABELS
 
 # Import new real-time components
 from ui.live_event_panel import render_live_event_panel, render_pipeline_status_card
@@ -55,40 +57,26 @@ def render_intelligence_dashboard(project_name: str):
     
     st.markdown("---")
     
-    # Quick stats
+    # Quick stats, read in one try; anything that fails keeps its default
+    status, event_count, audit_count = "Idle", 0, 0
+    try:
+        status = REGISTRY.get_pipeline_controller(project_name).get_status()["status"].title()
+        event_count = len(REGISTRY.get_event_bus(project_name).buffer)
+        # Indexed count; only newly appended lines are read
+        audit_count = f"{REGISTRY.get_audit_log(project_name).count():,}"
+    except Exception:
+        pass
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        try:
-            pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
-            stats = pipeline_controller.get_status()
-            st.metric("Pipeline Status", stats["status"].title())
-        except:
-            st.metric("Pipeline Status", "Idle")
+        st.metric("Pipeline Status", status)
     
     with col2:
-        try:
-            event_bus = REGISTRY.get_event_bus(project_name)
-            event_count = len(list(event_bus.buffer))
-            st.metric("Recent Events", event_count)
-        except:
-            st.metric("Recent Events", 0)
+        st.metric("Recent Events", event_count)
     
     with col3:
-        try:
-            audit_log = REGISTRY.get_audit_log(project_name)
-            # Count entries (approximate)
-            import json
-            count = 0
-            try:
-                with open(audit_log.log_path, 'r') as f:
-                    for _ in f:
-                        count += 1
-                st.metric("Audit Entries", f"{count:,}")
-            except:
-                st.metric("Audit Entries", 0)
-        except:
-            st.metric("Audit Entries", 0)
+        st.metric("Audit Entries", audit_count)
     
     st.markdown("---")
     
@@ -125,13 +113,13 @@ def render_feedback_tab(project_name: str):
             st.metric("Processed", stats["processed"])
         
         # Priority distribution
-        if stats["by_priority"]:
+        if stats["total"] and stats["by_priority"]:
             st.markdown("#### Priority Distribution")
+            total = stats["total"]
             for priority, count in stats["by_priority"].items():
                 if count > 0:
-                    # Progress bars don't need keys usually, but add one to be safe
                     st.progress(
-                        count / max(stats["total"], 1),
+                        count / total,
                         text=f"{priority}: {count}"
                     )
         
@@ -139,9 +127,11 @@ def render_feedback_tab(project_name: str):
         st.info("Feedback manager not initialized")
 
 
+@st.fragment
 def render_audit_log_tab(project_name: str):
     """
     Render audit log search and view tab.
+    Runs as a fragment, so filter edits don't re-run the other tabs.
     """
     st.subheader("📋 Audit Log Search")
     
@@ -160,76 +150,127 @@ def render_audit_log_tab(project_name: str):
         )
     
     with col2:
-        search_limit = st.number_input(
-            "Max Results",
+        page_size = st.number_input(
+            "Results per Page",
             min_value=10,
-            max_value=1000,
-            value=100,
-            key=f"audit_search_limit_{project_name}"
+            max_value=200,
+            value=25,
+            key=f"audit_page_size_{project_name}"
         )
     
-    # Sender filter
+    # Full-text query (every word must appear in sender, recipient or payload)
+    text_query = st.text_input(
+        "Search Text (optional)",
+        placeholder="e.g., dragon chapter",
+        key=f"audit_text_query_{project_name}"
+    )
+    
+    # Sender filter (substring, case-insensitive)
     sender_filter = st.text_input(
         "Filter by Sender (optional)",
         placeholder="e.g., plot_architect, user",
         key=f"audit_sender_filter_{project_name}"
     )
     
-    # Search button
+    # Search button fixes the query; pages are then read on demand
+    query_key = f"_audit_query_{project_name}"
+    page_key = f"audit_page_{project_name}"
     if st.button("🔍 Search Audit Log", type="primary", key=f"audit_search_btn_{project_name}"):
-        event_type_param = None if event_type == "all" else event_type
-        
-        results = audit_log.search(
-            event_type=event_type_param,
-            limit=search_limit
+        st.session_state[query_key] = (
+            None if event_type == "all" else event_type,
+            text_query.strip() or None,
+            sender_filter.strip() or None
         )
-        
-        # Apply sender filter if specified
-        if sender_filter:
-            results = [r for r in results if sender_filter.lower() in r.sender.lower()]
-        
-        # Display results
-        if not results:
-            st.info("No audit log entries found.")
-        else:
-            st.write(f"Found {len(results)} entries:")
-            
-            for idx, entry in enumerate(results):
-                with st.expander(
-                    f"{entry.sender} → {entry.recipient} - {entry.event_type} ({entry.timestamp})",
-                    expanded=(idx < 3)
-                ):
-                    st.json(entry.payload)
+        st.session_state[page_key] = 1
+    
+    if query_key not in st.session_state:
+        return
+    query_type, query_text, query_sender = st.session_state[query_key]
+    
+    total = audit_log.count(query_type, q=query_text, sender_contains=query_sender)
+    page_count = max(1, -(-total // page_size))
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+    page = st.number_input(
+        "Page",
+        min_value=1,
+        max_value=page_count,
+        key=page_key,
+        help=f"{page_count} page(s)"
+    )
+    
+    # Only the current page is read; kept until the page or log changes.
+    # On a fresh read, entries are rendered as they come off disk.
+    results_key = f"_audit_results_{project_name}"
+    page_id = (query_type, query_text, query_sender, page, page_size, audit_log.version)
+    cached = st.session_state.get(results_key)
+    if cached is not None and cached[0] == page_id:
+        entries = cached[1]
+    else:
+        entries = audit_log.search_iter(
+            event_type=query_type,
+            q=query_text,
+            sender_contains=query_sender,
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
+    
+    summary = st.empty()
+    page_entries = []
+    for entry in entries:
+        with st.expander(
+            f"{entry.sender} → {entry.recipient} - {entry.event_type} ({entry.timestamp})",
+            expanded=(len(page_entries) < 3)
+        ):
+            # Plain code block: orjson is fast and this avoids a JSON viewer widget per row
+            st.code(orjson.dumps(entry.payload, option=orjson.OPT_INDENT_2, default=str).decode(),
+                    language="json")
+        page_entries.append(entry)
+    
+    st.session_state[results_key] = (page_id, page_entries)
+    
+    # Display summary above the entries
+    if page_entries:
+        summary.write(f"Showing {len(page_entries)} of {total:,} entries:")
+    else:
+        summary.info("No audit log entries found.")
 
 
+@st.fragment
 def render_feedback_injector_compact(project_name: str):
     """
     Compact version of feedback injector for dashboard.
+    Runs as a fragment, so sending a message doesn't re-run the dashboard.
     """
     try:
         pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
         feedback_manager = pipeline_controller.feedback_manager
         
-        # Quick target selection
-        target = st.selectbox(
-            "To",
-            options=["ALL", "plot_architect", "worldbuilder", "character_agent"],
-            key=f"quick_feedback_target_{project_name}"
-        )
-        
-        # Quick message
-        message = st.text_area(
-            "Message",
-            placeholder="Quick feedback...",
-            height=80,
-            key=f"quick_feedback_message_{project_name}"
-        )
+        # One form: typing and picking a target don't trigger reruns
+        with st.form(f"quick_feedback_form_{project_name}", clear_on_submit=True):
+            target = st.selectbox(
+                "To",
+                options=AGENTS,
+                format_func=AGENT_LABELS.__getitem__,
+                key=f"quick_feedback_target_{project_name}"
+            )
+            
+            message = st.text_area(
+                "Message",
+                placeholder="Quick feedback...",
+                height=80,
+                key=f"quick_feedback_message_{project_name}"
+            )
+            
+            submitted = st.form_submit_button("💬 Send", use_container_width=True)
         
-        if st.button("💬 Send", use_container_width=True, key=f"quick_feedback_btn_{project_name}"):
+        if submitted:
             if message.strip():
                 from core.feedback_manager import FeedbackType, FeedbackPriority
                 
-                feedback_manager.add_feedback(
+                # Stored now; the EventBus publish runs on a background worker
+                feedback_manager.add_and_publish(
+                    REGISTRY.get_event_bus(project_name),
                     target_agent=target,
                     feedback_type=FeedbackType.GUIDANCE,
                     content=message.strip(),
@@ -238,7 +279,6 @@ def render_feedback_injector_compact(project_name: str):
                 )
                 
                 st.success("Feedback sent!")
-                st.rerun()
             else:
                 st.warning("Enter a message")
                 
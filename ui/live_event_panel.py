@@ -2,10 +2,15 @@
 Real-time event stream with WebSocket integration.
 """
 
-import streamlit as st
+import json
+import threading
 import time
+
+import pandas as pd
+import streamlit as st
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional
 
 from core.registry import REGISTRY
 
@@ -72,150 +77,132 @@ def render_live_event_panel(project_name: str):
         
         st.markdown("---")
         
-        # Display events from multiple sources
-        display_combined_events(project_name, event_limit)
+        # Display events (refreshes on its own)
+        _live_events(project_name, event_limit)
         
         # Auto-refresh note
         if client and client.running:
             st.caption("🔔 Events update in real-time via WebSocket")
         else:
-            st.caption("⏱️ Click Refresh to update events")
+            st.caption("⏱️ Events refresh every second")
+
+
+@st.fragment(run_every="1s")
+def _live_events(project_name: str, limit: int):
+    """
+    Event table as a polling fragment: only this block re-runs each
+    second, and the rest of the app isn't re-run to refresh it.
+    """
+    display_combined_events(project_name, limit)
 
 
 def display_combined_events(project_name: str, limit: int):
     """
-    Display events from both EventBus buffer and WebSocket messages.
+    Display recent events, newest first, from the EventBus buffer.
+    
+    Every EventBus event is also broadcast over the WebSocket, so the bus
+    is the one source read on each refresh. Unlike the session's WebSocket
+    buffer, it also holds events published before this session connected
+    and isn't capped at 50.
     """
-    # Get EventBus events
     event_bus = REGISTRY.get_event_bus(project_name)
-    bus_events = list(event_bus.buffer)[-limit:]
+    display_events = list(_bus_event_dicts(reversed(event_bus.tail(limit))))
     
-    # Get WebSocket events (only if available)
-    ws_events = []
-    if WEBSOCKET_AVAILABLE and StreamlitWebSocketClient:
-        try:
-            ws_events = StreamlitWebSocketClient.get_latest_messages(project_name, limit)
-        except Exception as e:
-            print(f"[LiveEvents] Failed to get WebSocket messages: {e}")
-    
-    # Combine and sort by timestamp
-    all_events = []
+    # Display
+    if not display_events:
+        st.info("No events yet. Start a pipeline to see live events.")
+        return
     
-    # Add EventBus events
-    for event in bus_events:
-        all_events.append({
-            'source': 'eventbus',
+    # One table instead of a card per event
+    rows = [_event_row(event) for event in display_events]
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+
+def _bus_event_dicts(events) -> Iterator[Dict[str, Any]]:
+    """EventBus events as display dicts"""
+    for event in events:
+        yield {
+            'id': event.id,
             'type': event.type,
             'sender': event.sender,
             'recipient': event.recipient,
             'payload': event.payload,
             'timestamp': event.timestamp
-        })
-    
-    # Add WebSocket events
-    for event in ws_events:
-        if event.get('type') == 'eventbus_message':
-            data = event.get('data', {})
-            all_events.append({
-                'source': 'websocket',
-                'type': data.get('event_type'),
-                'sender': data.get('sender'),
-                'recipient': data.get('recipient'),
-                'payload': data.get('payload'),
-                'timestamp': event.get('timestamp')
-            })
-    
-    # Sort by timestamp (newest first)
-    all_events.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-    
-    # Display
-    if not all_events:
-        st.info("No events yet. Start a pipeline to see live events.")
-        return
+        }
+
+
+# (substring of lowercased event type, icon), checked in order
+_EVENT_ICONS = (
+    ("error", "❌"),
+    ("complete", "✅"),
+    ("success", "✅"),
+    ("progress", "📊"),
+    ("paused", "⏸️"),
+    ("stopped", "⏸️"),
+    ("start", "🚀"),
+)
+
+
+@lru_cache(maxsize=256)
+def _event_icon(event_type: str) -> str:
+    """Icon for an event type; the few distinct types make this a dict hit"""
+    lowered = event_type.lower()
+    return next((icon for key, icon in _EVENT_ICONS if key in lowered), "📝")
+
+
+# Serialized payloads by event id (events are immutable once published),
+# so the polling table doesn't re-serialize the same payloads every second
+_PAYLOAD_JSON: Dict[str, str] = {}
+_PAYLOAD_JSON_MAX = 4096
+_PAYLOAD_JSON_LOCK = threading.Lock()
+
+
+def _payload_json(event_id: Optional[str], payload: Any) -> str:
+    """
+    Compact JSON for a payload, memoized by event id.
+    """
+    if event_id is not None:
+        # Single lookup: another session may evict the key between check and read
+        cached = _PAYLOAD_JSON.get(event_id)
+        if cached is not None:
+            return cached
     
-    # Limit display
-    display_events = all_events[:limit]
+    try:
+        payload_str = json.dumps(payload, default=str) if payload else ""
+    except (TypeError, ValueError):
+        payload_str = str(payload)
     
-    for idx, event in enumerate(display_events):
-        render_event_card(event, idx, project_name)
+    if event_id is not None:
+        with _PAYLOAD_JSON_LOCK:  # Sessions render from separate threads
+            if len(_PAYLOAD_JSON) >= _PAYLOAD_JSON_MAX:
+                # Drop the oldest entry (dicts keep insertion order)
+                del _PAYLOAD_JSON[next(iter(_PAYLOAD_JSON))]
+            _PAYLOAD_JSON[event_id] = payload_str
+    return payload_str
 
 
-def render_event_card(event: Dict[str, Any], idx: int, project_name: str):
+def _event_row(event: Dict[str, Any]) -> Dict[str, str]:
     """
-    Render a single event as a styled card.
+    Flatten an event into a table row.
     """
-    # Determine color based on event type
-    event_type = event.get('type', '').lower()
-    
-    if "error" in event_type:
-        border_color = "#ff4444"
-        icon = "❌"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
-    elif "complete" in event_type or "success" in event_type:
-        border_color = "#44ff44"
-        icon = "✅"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
-    elif "progress" in event_type:
-        border_color = "#4488ff"
-        icon = "📊"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
-    elif "paused" in event_type or "stopped" in event_type:
-        border_color = "#ffaa44"
-        icon = "⏸️"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
-    elif "start" in event_type:
-        border_color = "#44ffaa"
-        icon = "🚀"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
-    else:
-        border_color = "#888888"
-        icon = "📝"
-        source_badge = "🔄" if event.get('source') == 'websocket' else "💾"
+    event_type = event.get('type') or 'Unknown'
+    icon = _event_icon(event_type)
     
     # Format timestamp
-    timestamp = event.get('timestamp', time.time())
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        time_str = dt.strftime("%H:%M:%S.%f")[:-3]  # Milliseconds
-    except:
+        time_str = datetime.fromtimestamp(event.get('timestamp', time.time())).strftime("%H:%M:%S.%f")[:-3]
+    except (TypeError, ValueError, OverflowError, OSError):
         time_str = "Unknown"
     
-    # Create card
-    with st.container():
-        st.markdown(f"""
-        <div style="
-            border-left: 4px solid {border_color};
-            background: linear-gradient(90deg, rgba(255,255,255,0.1) 0%, rgba(255,255,255,0.05) 100%);
-            padding: 12px;
-            margin: 8px 0;
-            border-radius: 4px;
-            font-family: monospace;
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <strong>{icon} {event.get('type', 'Unknown')}</strong>
-                    <span style="color: #888; font-size: 0.9em; margin-left: 10px;">
-                        {time_str}
-                    </span>
-                </div>
-                <div style="color: #aaa; font-size: 0.9em;">
-                    {source_badge} {event.get('sender', 'Unknown')} → {event.get('recipient', 'Unknown')}
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        # Payload
-        payload = event.get('payload')
-        if payload:
-            import json
-            try:
-                payload_str = json.dumps(payload, indent=2)
-                with st.expander("Payload", expanded=False):
-                    st.code(payload_str, language="json")
-            except:
-                pass
-        
-        st.markdown("</div>", unsafe_allow_html=True)
+    payload_str = _payload_json(event.get('id'), event.get('payload'))
+    
+    return {
+        'time': time_str,
+        'type': f"{icon} {event_type}",
+        'sender': event.get('sender') or 'Unknown',
+        'recipient': event.get('recipient') or 'Unknown',
+        'payload': payload_str,
+    }
 
 
 def render_pipeline_status_card(project_name: str):
@@ -223,9 +210,8 @@ def render_pipeline_status_card(project_name: str):
     Render a status card for the current pipeline.
     """
     try:
-        # Get pipeline controller
-        pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
-        status = pipeline_controller.get_status()
+        # Get pipeline controller from the registry; one status snapshot per render
+        status = REGISTRY.get_pipeline_controller(project_name).get_status()
         
         # Status indicators
         status_icons = {
@@ -1,11 +1,28 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import streamlit as st
-from memory_store import MemoryStore
+from core.registry import REGISTRY
 from project_manager.loader import save_project_state
 from project_manager.state import extract_state_from_session
 
+logger = logging.getLogger(__name__)
+
+# Persists project state off the script thread so the rerun isn't blocked on disk I/O.
+# A single worker keeps saves in submission order, so an older snapshot never
+# overwrites a newer one.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="project_save")
+
+
+def _log_save_error(future: Future) -> None:
+    """Done-callback: report a failed background save instead of dropping it"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Saving project state failed", exc_info=exc)
+
 
 def render_memory_add(project_name):
-    memory = MemoryStore(project_name)
+    memory = REGISTRY.get_memory_store(project_name)
 
     st.header("Add Memory")
 
@@ -17,7 +34,9 @@ def render_memory_add(project_name):
             memory.add(new_memory)
             st.success("Memory added!")
             st.session_state["new_memory_text"] = ""
-            save_project_state(project_name, extract_state_from_session())
+            # Snapshot session state here; only the write runs in the pool
+            future = _SAVE_POOL.submit(save_project_state, project_name, extract_state_from_session())
+            future.add_done_callback(_log_save_error)
         else:
             st.info("Enter some text to add to memory.")
 
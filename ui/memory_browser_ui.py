@@ -1,9 +1,9 @@
 import streamlit as st
-from memory_store import MemoryStore
+from core.registry import REGISTRY
 
 
 def render_memory_browser(project_name):
-    memory = MemoryStore(project_name)
+    memory = REGISTRY.get_memory_store(project_name)
 
     with st.expander("🧠 Memory Browser", expanded=False):
         if st.button("Refresh Memory Browser", key="refresh_memory"):
@@ -1,9 +1,9 @@
 import streamlit as st
-from memory_store import MemoryStore
+from core.registry import REGISTRY
 
 
 def render_memory_search(project_name):
-    memory = MemoryStore(project_name)
+    memory = REGISTRY.get_memory_store(project_name)
 
     st.header("Memory Search")
 
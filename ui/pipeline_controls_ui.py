@@ -2,12 +2,37 @@
 Pipeline control UI with inline and expander versions
 """
 
+import asyncio
 import streamlit as st
 from typing import Optional
 
 from core.registry import REGISTRY
 from ui.common import get_producer
 
+# Pipeline types (in display order) -> selectbox labels
+PIPELINE_LABELS = {
+    "story_bible": "📖 Story Bible",
+    "chapter": "📄 Single Chapter",
+    "full_story": "📚 Full Story",
+    "director": "🎬 Director Mode",
+}
+PIPELINE_OPTIONS = tuple(PIPELINE_LABELS)
+
+# Arguments shared by the multi-chapter pipelines (on top of the common args)
+_CHAPTER_RUN_ARGS = {
+    "run_continuity": True,
+    "run_editor": True,
+    "max_chapters": 10,
+}
+
+# Pipeline type -> (ProducerAgent async method, total steps, task name, extra args)
+PIPELINE_DISPATCH = {
+    "story_bible": ("run_story_bible_pipeline_async", 3, "Story Bible Generation", {}),
+    "chapter": ("run_chapter_pipeline_async", 5, "Chapter {chapter} Generation", _CHAPTER_RUN_ARGS),
+    "full_story": ("run_full_story_pipeline_async", 13, "Full Story Generation", _CHAPTER_RUN_ARGS),  # 10 chapters + 3 steps
+    "director": ("run_director_mode_async", 10, "Director Mode", _CHAPTER_RUN_ARGS),
+}
+
 
 def render_pipeline_controls_inline(project_name: str):
     """
@@ -23,59 +48,54 @@ def render_pipeline_controls_inline(project_name: str):
     
     render_id = st.session_state[f"pipeline_render_count_{project_name}"]
     
-    # Get pipeline controller
+    # Get pipeline controller from the registry; one status snapshot per render
     pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
     status = pipeline_controller.get_status()
+    active = status["is_running"] or status["is_paused"]
     
-    # Layout: Pipeline Type + Buttons in one row
-    col1, col2, col3, col4, col5, col6 = st.columns([3, 1, 1, 1, 1, 1])
-    
-    with col1:
-        # Pipeline type dropdown - KEEP THE LABEL VISIBLE
-        pipeline_type = st.selectbox(
-            "Pipeline Type",
-            options=["story_bible", "chapter", "full_story", "director"],
-            format_func=lambda x: {
-                "story_bible": "📖 Story Bible",
-                "chapter": "📄 Single Chapter",
-                "full_story": "📚 Full Story",
-                "director": "🎬 Director Mode"
-            }[x],
-            key=f"pipeline_type_{project_name}_{render_id}",
-            disabled=status["is_running"] or status["is_paused"]
-        )
-        st.session_state[f"selected_pipeline_type_{project_name}"] = pipeline_type
+    # Layout: Start form (type, chapter, Start) + control buttons in one row.
+    # The form batches type/chapter edits into the single Start rerun.
+    col_form, col4, col5, col6 = st.columns([5, 1, 1, 1])
     
-    with col2:
-        # Chapter index (only for chapter pipeline)
-        if pipeline_type == "chapter":
-            chapter_index = st.number_input(
-                "Ch #",
-                min_value=0,
-                max_value=99,
-                value=0,
-                key=f"chapter_idx_{project_name}_{render_id}",
-                disabled=status["is_running"] or status["is_paused"],
-                label_visibility="collapsed"
-            )
-        else:
-            chapter_index = None
-            st.write("")  # Empty space for alignment
+    with col_form:
+        with st.form(f"pipeline_start_form_{project_name}_{render_id}", border=False):
+            col1, col2, col3 = st.columns([3, 1, 1])
+            
+            with col1:
+                # Pipeline type dropdown - KEEP THE LABEL VISIBLE
+                pipeline_type = st.selectbox(
+                    "Pipeline Type",
+                    options=PIPELINE_OPTIONS,
+                    format_func=PIPELINE_LABELS.__getitem__,
+                    key=f"pipeline_type_{project_name}_{render_id}",
+                    disabled=active
+                )
+                st.session_state[f"selected_pipeline_type_{project_name}"] = pipeline_type
+            
+            with col2:
+                # Chapter index (always shown: the form doesn't rerun on type
+                # change; only used by the chapter pipeline)
+                chapter_index = st.number_input(
+                    "Ch #",
+                    min_value=0,
+                    max_value=99,
+                    value=0,
+                    key=f"chapter_idx_{project_name}_{render_id}",
+                    disabled=active,
+                    help="Single Chapter pipeline only"
+                )
+            
+            with col3:
+                # Start button
+                started = st.form_submit_button("▶️ Start",
+                                                type="secondary",
+                                                disabled=active,
+                                                use_container_width=True)
     
-    with col3:
-        # Start button
-        if not (status["is_running"] or status["is_paused"]):
-            if st.button("▶️ Start",
-                        type="secondary",
-                        key=f"start_{project_name}_{render_id}",
-                        use_container_width=True):
-                st.session_state[f"pipeline_render_count_{project_name}"] += 1
-                _start_pipeline_ui(project_name, str(render_id), pipeline_type, chapter_index)
-        else:
-            st.button("▶️ Start",
-                     disabled=True,
-                     key=f"start_disabled_{project_name}_{render_id}",
-                     use_container_width=True)
+    if started and not active:
+        st.session_state[f"pipeline_render_count_{project_name}"] += 1
+        _start_pipeline_ui(project_name, str(render_id), pipeline_type,
+                           chapter_index if pipeline_type == "chapter" else None)
     
     with col4:
         # Pause button
@@ -102,7 +122,7 @@ def render_pipeline_controls_inline(project_name: str):
     with col6:
         # Stop button
         if st.button("⏹️ Stop",
-                    disabled=not (status["is_running"] or status["is_paused"]),
+                    disabled=not active,
                     type="secondary",
                     key=f"stop_{project_name}_{render_id}",
                     use_container_width=True):
@@ -118,6 +138,23 @@ def render_pipeline_controls_inline(project_name: str):
         pass  # Silently fail if component not available
 
 
+def run_async_in_thread(coro):
+    """
+    Run a coroutine to completion on a fresh event loop for the calling thread.
+    
+    Each pipeline runs on its own thread and keeps its own loop (not one
+    shared reactor) because the pipelines block in wait_for_resume() while
+    paused. The loop is closed when the run ends, since its thread exits.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
 def _start_pipeline_ui(
     project_name: str, 
     render_id: str, 
@@ -140,73 +177,22 @@ def _start_pipeline_ui(
             "auto_memory": True,
         }
         
-        # Get the appropriate pipeline function (wrap async in sync for thread)
-        import asyncio
-        
-        def run_async_in_thread(coro):
-            """Helper to run async function in background thread"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(coro)
-            finally:
-                loop.close()
-        
-        if pipeline_type == "story_bible":
-            # Story bible ONLY takes common args
-            pipeline_args = common_args
-            
-            def pipeline_func(controller=None, feedback_manager=None, **kwargs):
-                return run_async_in_thread(producer.run_story_bible_pipeline_async(**kwargs))
-            task_name = "Story Bible Generation"
-            total_steps = 3
-            
-        elif pipeline_type == "chapter":
-            # Chapter takes additional args
-            pipeline_args = {
-                **common_args,
-                "run_continuity": True,
-                "run_editor": True,
-                "max_chapters": 10,
-                "chapter_index": chapter_index or 0
-            }
-            
-            def pipeline_func(controller=None, feedback_manager=None, **kwargs):
-                return run_async_in_thread(producer.run_chapter_pipeline_async(**kwargs))
-            task_name = f"Chapter {chapter_index} Generation"
-            total_steps = 5
-            
-        elif pipeline_type == "full_story":
-            # Full story takes additional args
-            pipeline_args = {
-                **common_args,
-                "run_continuity": True,
-                "run_editor": True,
-                "max_chapters": 10,
-            }
-            
-            def pipeline_func(controller=None, feedback_manager=None, **kwargs):
-                return run_async_in_thread(producer.run_full_story_pipeline_async(**kwargs))
-            task_name = "Full Story Generation"
-            total_steps = 13  # 10 chapters + 3 steps
-            
-        elif pipeline_type == "director":
-            # Director mode takes additional args
-            pipeline_args = {
-                **common_args,
-                "run_continuity": True,
-                "run_editor": True,
-                "max_chapters": 10,
-            }
-            
-            def pipeline_func(controller=None, feedback_manager=None, **kwargs):
-                return run_async_in_thread(producer.run_director_mode_async(**kwargs))
-            task_name = "Director Mode"
-            total_steps = 10
-            
-        else:
+        # Look up the pipeline; unknown types are rejected
+        if pipeline_type not in PIPELINE_DISPATCH:
             st.error(f"Unknown pipeline type: {pipeline_type}")
             return
+        method_name, total_steps, task_name, extra_args = PIPELINE_DISPATCH[pipeline_type]
+        
+        pipeline_args = {**common_args, **extra_args}
+        if pipeline_type == "chapter":
+            pipeline_args["chapter_index"] = chapter_index or 0
+            task_name = task_name.format(chapter=chapter_index)
+        
+        # Wrap the async producer method in sync for the pipeline thread
+        run_pipeline_async = getattr(producer, method_name)
+        
+        def pipeline_func(controller=None, feedback_manager=None, **kwargs):
+            return run_async_in_thread(run_pipeline_async(**kwargs))
         
         # Start the pipeline
         print(f"[UI] Starting pipeline: {task_name}")
@@ -238,11 +224,14 @@ def _start_pipeline_ui(
         st.code(traceback.format_exc())
 
 
+@st.fragment(run_every="2s")
 def render_pipeline_status_overview(project_name: str):
-    """Render compact pipeline status overview."""
+    """
+    Render compact pipeline status overview.
+    Polls as a fragment, so the status stays current without re-running the app.
+    """
     try:
-        pipeline_controller = REGISTRY.get_pipeline_controller(project_name)
-        status = pipeline_controller.get_status()
+        status = REGISTRY.get_pipeline_controller(project_name).get_status()
         
         col1, col2, col3 = st.columns(3)
         
@@ -8,16 +8,28 @@ from project_manager.registry import (
 )
 from project_manager.loader import load_project_state, save_project_state
 from project_manager.state import load_state_into_session, extract_state_from_session
+from core.registry import REGISTRY
+from ui.common import clear_producer
 from ui.initialization import ensure_project_exists
 
 
+@st.cache_data(ttl=10.0, show_spinner=False)
+def _discover_projects() -> list:
+    """Project names on disk; cached so reruns don't rescan project_state/"""
+    return get_all_projects()
+
+
 def render_sidebar():
     st.sidebar.header("Project Management")
 
     # Ensure default_project exists before listing
     ensure_project_exists("default_project")
 
-    existing = get_all_projects()
+    existing = _discover_projects()
+    if st.session_state["current_project"] not in existing:
+        # Created since the cached scan (e.g. in another session)
+        _discover_projects.clear()
+        existing = _discover_projects()
     if "default_project" not in existing:
         existing.insert(0, "default_project")
 
@@ -65,6 +77,7 @@ def render_sidebar():
             name = name.strip()
             if name:
                 create_project_if_missing(name)
+                _discover_projects.clear()
                 st.session_state["current_project"] = name
                 load_state_into_session(load_project_state(name))
                 st.rerun()
@@ -81,6 +94,7 @@ def render_sidebar():
             dst = dup_name.strip()
             if dst:
                 duplicate_project_state(src, dst)
+                _discover_projects.clear()
                 st.session_state["current_project"] = dst
                 load_state_into_session(load_project_state(dst))
                 st.rerun()
@@ -133,6 +147,11 @@ def render_sidebar():
             st.sidebar.error("Cannot delete the default project.")
         else:
             delete_project(name)
+            _discover_projects.clear()
+            st.session_state.get("_ensured_projects", set()).discard(name)
+            # Drop cached stores so a recreated project starts empty
+            REGISTRY.clear_project(name)
+            clear_producer(name)
             st.session_state["current_project"] = "default_project"
             load_state_into_session(load_project_state("default_project"))
             st.sidebar.success(f"Deleted project '{name}'.")